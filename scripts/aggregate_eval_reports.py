@@ -5,9 +5,11 @@ from __future__ import annotations
 
 import argparse
 import json
+import math
 import re
 import statistics
-from collections import Counter, defaultdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -27,43 +29,94 @@ def parse_args() -> argparse.Namespace:
 
 
 def mean_std(values: list[float]) -> dict[str, float]:
-    if not values:
+    n = len(values)
+    if n == 0:
         return {"mean": 0.0, "std": 0.0}
-    if len(values) == 1:
+    if n == 1:
         return {"mean": values[0], "std": 0.0}
-    return {"mean": statistics.mean(values), "std": statistics.pstdev(values)}
+    # Population std over plain floats; avoids the exact-fraction arithmetic
+    # that statistics.mean/pstdev use internally.
+    mean = statistics.fmean(values)
+    variance = math.fsum((x - mean) * (x - mean) for x in values) / n
+    return {"mean": mean, "std": math.sqrt(variance)}
+
+
+# Each alternative is a zero-width lookahead anchored at the start of the
+# text, so alternatives are tried in priority order (not by leftmost match)
+# and the whole classification is a single case-insensitive regex call.
+_ERROR_CLASS_RE = re.compile(
+    r"""
+    \A(?:
+        (?=.*?(?:expected\ value,\ found\ crate|cannot\ find))(?P<name_resolution>)
+      | (?=.*?this\ function\ takes)(?=.*?argument)(?P<wrong_signature_or_call>)
+      | (?=.*?mismatched\ types)(?P<type_mismatch>)
+      | (?=.*?(?:unexpectedtoken|parse\ error))(?P<parse_error>)
+      | (?=.*?expected\ `i32`,\ found\ closure)(?P<closure_return_shape>)
+    )
+    """,
+    re.DOTALL | re.IGNORECASE | re.VERBOSE,
+)
+
+
+def load_report(path: Path) -> dict[str, Any]:
+    report = json.loads(path.read_bytes())
+    rows_file = report.get("rows_file")
+    if rows_file is not None:
+        # Newer reports keep per-row results in an NDJSON sidecar.
+        for arm in ("rust", "iron"):
+            report[arm]["rows"] = []
+        with (path.parent / rows_file).open("rb") as f:
+            for line in f:
+                if line.strip():
+                    row = json.loads(line)
+                    report[row["arm"]]["rows"].append(row)
+    return report
+
+
+def rate(count: float, total: float) -> float:
+    return count / total if total else 0.0
 
 
 def classify_error(message: str, phase: str) -> str:
-    text = message.lower()
-    if not text:
+    if not message:
         return "none"
     if phase == "transform":
         return "iron_parse_or_oxidize"
 
-    if "expected value, found crate" in text:
-        return "name_resolution"
-    if "cannot find" in text:
-        return "name_resolution"
-    if "this function takes" in text and "argument" in text:
-        return "wrong_signature_or_call"
-    if "mismatched types" in text:
-        return "type_mismatch"
-    if "unexpectedtoken" in text or "parse error" in text:
-        return "parse_error"
-    if "expected `i32`, found closure" in text:
-        return "closure_return_shape"
-    return "other"
+    match = _ERROR_CLASS_RE.match(message)
+    if match is None:
+        return "other"
+    return match.lastgroup or "other"
+
+
+def row_failure(row: dict[str, Any]) -> tuple[str, str] | None:
+    """Return (message, phase) for the first failing phase of a row, if any."""
+    if not row.get("transform_ok", True):
+        return row.get("transform_error", ""), "transform"
+    if not row.get("compile_ok", False):
+        return row.get("compile_error", ""), "compile"
+    if not row.get("test_ok", False):
+        return row.get("test_error", ""), "test"
+    return None
 
 
 def aggregate(reports: list[dict[str, Any]]) -> dict[str, Any]:
     arms = ("rust", "iron")
+    # Summary metrics are one value per report, so each column is built in a
+    # single pass rather than appended to inside the per-report loop.
     arm_metrics: dict[str, dict[str, list[float]]] = {
-        arm: {"compile_at_1": [], "test_at_1": [], "transform_rate": []} for arm in arms
+        arm: {
+            "compile_at_1": [float(r[arm]["compile_at_1"]) for r in reports],
+            "test_at_1": [float(r[arm]["test_at_1"]) for r in reports],
+            "transform_rate": [
+                rate(r[arm]["transform_pass"], r[arm]["total"]) for r in reports
+            ],
+        }
+        for arm in arms
     }
 
     per_family_rates: dict[str, dict[str, dict[str, list[float]]]] = {
-        arm: defaultdict(lambda: {"compile": [], "test": []}) for arm in arms
+        arm: {} for arm in arms
     }
 
     error_taxonomy: dict[str, Counter[str]] = {arm: Counter() for arm in arms}
@@ -71,35 +124,20 @@ def aggregate(reports: list[dict[str, Any]]) -> dict[str, Any]:
     for report in reports:
         for arm in arms:
             data = report[arm]
-            total = data["total"]
-            arm_metrics[arm]["compile_at_1"].append(float(data["compile_at_1"]))
-            arm_metrics[arm]["test_at_1"].append(float(data["test_at_1"]))
-            arm_metrics[arm]["transform_rate"].append(
-                data["transform_pass"] / total if total else 0.0
-            )
-
+            family_rates = per_family_rates[arm]
             for family, stats in data["per_family"].items():
+                bucket = family_rates.get(family)
+                if bucket is None:
+                    bucket = family_rates[family] = {"compile": [], "test": []}
                 n = stats["total"]
-                per_family_rates[arm][family]["compile"].append(
-                    stats["compile"] / n if n else 0.0
-                )
-                per_family_rates[arm][family]["test"].append(
-                    stats["test"] / n if n else 0.0
-                )
+                bucket["compile"].append(rate(stats["compile"], n))
+                bucket["test"].append(rate(stats["test"], n))
 
+            taxonomy = error_taxonomy[arm]
             for row in data.get("rows", []):
-                if not row.get("transform_ok", True):
-                    error_taxonomy[arm][
-                        classify_error(row.get("transform_error", ""), "transform")
-                    ] += 1
-                elif not row.get("compile_ok", False):
-                    error_taxonomy[arm][
-                        classify_error(row.get("compile_error", ""), "compile")
-                    ] += 1
-                elif not row.get("test_ok", False):
-                    error_taxonomy[arm][
-                        classify_error(row.get("test_error", ""), "test")
-                    ] += 1
+                failure = row_failure(row)
+                if failure is not None:
+                    taxonomy[classify_error(*failure)] += 1
 
     out: dict[str, Any] = {
         "num_reports": len(reports),
@@ -161,7 +199,10 @@ def print_human(agg: dict[str, Any]) -> None:
 
 def main() -> int:
     args = parse_args()
-    reports = [json.loads(p.read_text(encoding="utf-8")) for p in args.reports]
+    # Reads overlap across threads, which hides latency on slow or network
+    # filesystems; map() keeps reports in command-line order.
+    with ThreadPoolExecutor() as executor:
+        reports = list(executor.map(load_report, args.reports))
     agg = aggregate(reports)
     print_human(agg)
 
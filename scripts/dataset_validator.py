@@ -4,18 +4,46 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+import functools
+import hashlib
 import json
+import os
+import random
 import re
 import shlex
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 
-ALLOWED_SPLITS = {"train", "val", "test"}
+ALLOWED_SPLITS = frozenset({"train", "val", "test"})
+_ALLOWED_SPLITS_SORTED = sorted(ALLOWED_SPLITS)
+
+# Roundtrip compile results keyed by (crate name, sha256 of the Rust source);
+# identical oxidize outputs only need one rustc run per crate name. The name
+# is part of the key because rustc's crate-name lints (and `#![deny(...)]`
+# turning them into errors) depend on it.
+_COMPILE_CACHE: dict[tuple[str, str], subprocess.CompletedProcess[str]] = {}
+_COMPILE_CACHE_LOCK = threading.Lock()
+
+# reduce/oxidize results keyed by (command prefix, op, sha256 of the input),
+# so generated manifests with duplicate scaffolds only pay for them once.
+_REDOX_CACHE: dict[
+    tuple[tuple[str, ...], str, bytes], subprocess.CompletedProcess[bytes]
+] = {}
+_REDOX_CACHE_LOCK = threading.Lock()
+
+_SCRATCH = threading.local()
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_CRATE_NAME_INVALID_RE = re.compile(r"[^a-zA-Z0-9_]")
 
 
 @dataclass
@@ -39,11 +67,93 @@ class TaskResult:
     warnings: list[str] = field(default_factory=list)
     used_verbatim: bool = False
     reduce_deterministic: bool = False
+    determinism_checked: bool = False
     reduce_ok: bool = False
     oxidize_ok: bool = False
     roundtrip_compile_ok: bool = False
 
 
+class RedoxWorker:
+    """One long-lived `redox serve` process answering reduce/oxidize requests."""
+
+    def __init__(self, redox_prefix: list[str]) -> None:
+        self.cmd = [*redox_prefix, "serve"]
+        self.proc = subprocess.Popen(
+            self.cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def request(self, op: str, source: bytes) -> subprocess.CompletedProcess[bytes]:
+        assert self.proc.stdin is not None and self.proc.stdout is not None
+        self.proc.stdin.write(f"{op} {len(source)}\n".encode("ascii") + source)
+        self.proc.stdin.flush()
+
+        status, _, length = self.proc.stdout.readline().partition(b" ")
+        if status not in (b"ok", b"err") or not length.strip().isdigit():
+            raise RuntimeError(f"malformed response from {' '.join(self.cmd)}")
+        body = self.proc.stdout.read(int(length))
+
+        if status == b"ok":
+            return subprocess.CompletedProcess(self.cmd, 0, stdout=body, stderr=b"")
+        return subprocess.CompletedProcess(
+            self.cmd, 1, stdout=b"", stderr=b"Error: " + body + b"\n"
+        )
+
+    def close(self) -> None:
+        if self.proc.stdin is not None:
+            self.proc.stdin.close()
+        self.proc.wait()
+
+
+class RedoxWorkerPool:
+    """Hands each validation thread its own `RedoxWorker`."""
+
+    def __init__(self, redox_prefix: list[str]) -> None:
+        self.redox_prefix = redox_prefix
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._workers: list[RedoxWorker] = []
+
+    def request(
+        self, op: str, source: bytes
+    ) -> subprocess.CompletedProcess[bytes] | None:
+        """Run one request, or return None if the worker died and should be bypassed."""
+        worker = getattr(self._local, "worker", None)
+        if worker is None:
+            worker = RedoxWorker(self.redox_prefix)
+            self._local.worker = worker
+            with self._lock:
+                self._workers.append(worker)
+
+        try:
+            return worker.request(op, source)
+        except (OSError, RuntimeError):
+            # A crashed or desynced worker is replaced on the next request.
+            self._local.worker = None
+            worker.proc.kill()
+            return None
+
+    def close(self) -> None:
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            try:
+                worker.close()
+            except OSError:
+                worker.proc.kill()
+
+
+@dataclass
+class RedoxCommand:
+    """The redox command prefix plus the input transports it supports."""
+
+    prefix: list[str]
+    workers: RedoxWorkerPool | None = None
+    accepts_stdin: bool = False
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Validate dataset manifest against Redox experiment gates",
@@ -80,6 +190,19 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional path to write machine-readable report JSON",
     )
+    parser.add_argument(
+        "--determinism-sample",
+        type=float,
+        default=1.0,
+        help="Fraction of tasks whose reduce is re-run to check determinism "
+        "(default: 1.0, every task)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of tasks to validate concurrently (default: CPU count)",
+    )
     return parser.parse_args()
 
 
@@ -91,6 +214,14 @@ def main() -> int:
         print(f"ERROR: manifest not found: {manifest_path}", file=sys.stderr)
         return 2
 
+    if not 0.0 <= args.determinism_sample <= 1.0:
+        print("ERROR: --determinism-sample must be within [0, 1]", file=sys.stderr)
+        return 2
+
+    if args.jobs < 1:
+        print("ERROR: --jobs must be at least 1", file=sys.stderr)
+        return 2
+
     redox_prefix = shlex.split(args.redox_cmd)
     if not redox_prefix:
         print("ERROR: --redox-cmd cannot be empty", file=sys.stderr)
@@ -112,7 +243,22 @@ def main() -> int:
 
     split_errors = validate_split_hygiene(records)
 
-    task_results = [validate_task(record, redox_prefix, args) for record in records]
+    redox = RedoxCommand(
+        prefix=redox_prefix,
+        workers=RedoxWorkerPool(redox_prefix) if supports_serve(redox_prefix) else None,
+        accepts_stdin=supports_stdin(redox_prefix),
+    )
+
+    # Each task is dominated by redox/rustc subprocess waits, so threads are
+    # enough to overlap them; map() keeps results in manifest order.
+    try:
+        with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+            task_results = list(
+                executor.map(lambda record: validate_task(record, redox, args), records)
+            )
+    finally:
+        if redox.workers is not None:
+            redox.workers.close()
 
     gate_results = compute_gate_results(
         records, task_results, split_errors, args.purity_threshold
@@ -137,33 +283,32 @@ def load_manifest(manifest_path: Path) -> tuple[list[TaskRecord], list[str]]:
     errors: list[str] = []
     seen_ids: set[str] = set()
 
-    for idx, line in enumerate(
-        manifest_path.read_text(encoding="utf-8").splitlines(), start=1
-    ):
-        stripped = line.strip()
-        if not stripped:
-            continue
-        try:
-            raw = json.loads(stripped)
-        except json.JSONDecodeError as exc:
-            errors.append(f"line {idx}: invalid JSON ({exc})")
-            continue
-
-        if not isinstance(raw, dict):
-            errors.append(f"line {idx}: each JSONL record must be an object")
-            continue
-
-        line_errors, record = parse_record(raw, base_dir, idx)
-        errors.extend(line_errors)
-        if record is None:
-            continue
-
-        if record.task_id in seen_ids:
-            errors.append(f"line {idx}: duplicate id '{record.task_id}'")
-            continue
-
-        seen_ids.add(record.task_id)
-        records.append(record)
+    with manifest_path.open("rb") as manifest:
+        for idx, line in enumerate(manifest, start=1):
+            stripped = line.strip()
+            if not stripped:
+                continue
+            try:
+                raw = json.loads(stripped)
+            except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+                errors.append(f"line {idx}: invalid JSON ({exc})")
+                continue
+
+            if not isinstance(raw, dict):
+                errors.append(f"line {idx}: each JSONL record must be an object")
+                continue
+
+            line_errors, record = parse_record(raw, base_dir, idx)
+            errors.extend(line_errors)
+            if record is None:
+                continue
+
+            if record.task_id in seen_ids:
+                errors.append(f"line {idx}: duplicate id '{record.task_id}'")
+                continue
+
+            seen_ids.add(record.task_id)
+            records.append(record)
 
     if not records:
         errors.append("manifest contains no task records")
@@ -190,7 +335,7 @@ def parse_record(
 
     if not isinstance(split, str) or split not in ALLOWED_SPLITS:
         errors.append(
-            f"line {line_no}: 'split' must be one of {sorted(ALLOWED_SPLITS)}"
+            f"line {line_no}: 'split' must be one of {_ALLOWED_SPLITS_SORTED}"
         )
 
     if not isinstance(family, str) or not family:
@@ -232,7 +377,11 @@ def parse_record(
         ("rust_path", rust_path),
         ("tests_path", tests_path),
     ):
-        if path is not None and not path.exists():
+        if path is None:
+            continue
+        try:
+            os.stat(path)
+        except OSError:
             errors.append(f"line {line_no}: {label} does not exist: {path}")
 
     if errors:
@@ -257,7 +406,9 @@ def resolve_path(base_dir: Path, value: str) -> Path:
     p = Path(value)
     if p.is_absolute():
         return p
-    return (base_dir / p).resolve()
+    # base_dir is already resolved, so a lexical normalisation is enough and
+    # avoids Path.resolve()'s per-component symlink lookups.
+    return Path(os.path.normpath(base_dir / p))
 
 
 def validate_split_hygiene(records: list[TaskRecord]) -> list[str]:
@@ -275,7 +426,7 @@ def validate_split_hygiene(records: list[TaskRecord]) -> list[str]:
 
 
 def validate_task(
-    record: TaskRecord, redox_prefix: list[str], args: argparse.Namespace
+    record: TaskRecord, redox: RedoxCommand, args: argparse.Namespace
 ) -> TaskResult:
     result = TaskResult(
         task_id=record.task_id, split=record.split, family=record.family
@@ -289,30 +440,39 @@ def validate_task(
     if record.unsafe and not args.allow_unsafe:
         result.errors.append("unsafe=true is disallowed for phase-1")
 
-    source = record.rust_path.read_text(encoding="utf-8")
-    reduce_1 = run_reduce(redox_prefix, source, record.rust_path)
-    reduce_2 = run_reduce(redox_prefix, source, record.rust_path)
-
+    # Sources stay as bytes end to end; redox does its own UTF-8 decoding and
+    # only stderr is decoded, when it is reported.
+    source = record.rust_path.read_bytes()
+    reduce_1 = run_reduce(redox, source, record.rust_path)
     if reduce_1.returncode != 0:
         result.errors.append(f"reduce failed: {single_line(reduce_1.stderr)}")
         return result
 
-    if reduce_2.returncode != 0:
-        result.errors.append(f"second reduce failed: {single_line(reduce_2.stderr)}")
-        return result
-
-    result.reduce_ok = True
     iron_1 = reduce_1.stdout
-    iron_2 = reduce_2.stdout
 
-    if iron_1 == iron_2:
-        result.reduce_deterministic = True
+    if in_determinism_sample(record.task_id, args.determinism_sample):
+        # Bypass the cache so this is a genuine second run of reduce.
+        reduce_2 = run_reduce(redox, source, record.rust_path, use_cache=False)
+        if reduce_2.returncode != 0:
+            result.errors.append(
+                f"second reduce failed: {single_line(reduce_2.stderr)}"
+            )
+            return result
+
+        result.determinism_checked = True
+        if iron_1 == reduce_2.stdout:
+            result.reduce_deterministic = True
+        else:
+            result.errors.append("reduce output is non-deterministic")
     else:
-        result.errors.append("reduce output is non-deterministic")
+        result.reduce_deterministic = True
+        result.warnings.append("determinism unchecked")
 
-    result.used_verbatim = 'verbatim item "' in iron_1
+    result.reduce_ok = True
 
-    oxidize_proc = run_oxidize(redox_prefix, iron_1)
+    result.used_verbatim = b'verbatim item "' in iron_1
+
+    oxidize_proc = run_oxidize(redox, iron_1)
     if oxidize_proc.returncode != 0:
         result.errors.append(f"oxidize failed: {single_line(oxidize_proc.stderr)}")
         return result
@@ -331,53 +491,162 @@ def validate_task(
     return result
 
 
+def scratch_root() -> str | None:
+    """Pick where per-thread scratch directories go.
+
+    Same choice as evaluate_predictions.py: `REDOX_EVAL_TMPDIR` wins when
+    set; otherwise RAM-backed /dev/shm is used when it is writable and not
+    mounted noexec, so the short-lived inputs never touch disk. None means
+    the tempfile default.
+    """
+    override = os.environ.get("REDOX_EVAL_TMPDIR")
+    if override:
+        return override
+    if os.access("/dev/shm", os.W_OK):
+        try:
+            noexec = os.statvfs("/dev/shm").f_flag & os.ST_NOEXEC
+        except OSError:
+            noexec = True
+        if not noexec:
+            return "/dev/shm"
+    return None
+
+
+def scratch_dir() -> Path:
+    """Return this thread's scratch directory, created once and reused per call.
+
+    Each validation thread runs its subprocesses sequentially, so fixed file
+    names inside the directory cannot collide.
+    """
+    path = getattr(_SCRATCH, "path", None)
+    if path is None:
+        path = Path(tempfile.mkdtemp(prefix="redox_", dir=scratch_root()))
+        atexit.register(shutil.rmtree, path, ignore_errors=True)
+        _SCRATCH.path = path
+    return path
+
+
+def in_determinism_sample(task_id: str, rate: float) -> bool:
+    """Reproducibly pick whether a task gets its reduce output re-checked."""
+    if rate >= 1.0:
+        return True
+    return random.Random(task_id).random() < rate
+
+
+def supports_serve(redox_prefix: list[str]) -> bool:
+    """Return True if the redox binary understands the `serve` subcommand."""
+    try:
+        probe = subprocess.run(
+            [*redox_prefix, "serve"], input=b"", capture_output=True, check=False
+        )
+    except OSError:
+        return False
+    return probe.returncode == 0
+
+
+def supports_stdin(redox_prefix: list[str]) -> bool:
+    """Return True if the redox binary reads `-` as stdin."""
+    try:
+        probe = subprocess.run(
+            [*redox_prefix, "reduce", "-"], input=b"", capture_output=True, check=False
+        )
+    except OSError:
+        return False
+    return probe.returncode == 0
+
+
 def run_reduce(
-    redox_prefix: list[str], source: str, source_path: Path
-) -> subprocess.CompletedProcess[str]:
-    with tempfile.TemporaryDirectory(prefix="redox_reduce_") as tmp:
-        in_path = Path(tmp) / source_path.name
-        in_path.write_text(source, encoding="utf-8")
-        cmd = [*redox_prefix, "reduce", str(in_path)]
-        return subprocess.run(cmd, text=True, capture_output=True, check=False)
+    redox: RedoxCommand, source: bytes, source_path: Path, use_cache: bool = True
+) -> subprocess.CompletedProcess[bytes]:
+    if not use_cache:
+        return run_redox(redox, "reduce", source, source_path.name)
+    return run_redox_cached(redox, "reduce", source, source_path.name)
 
 
-def run_oxidize(redox_prefix: list[str], iron: str) -> subprocess.CompletedProcess[str]:
-    with tempfile.TemporaryDirectory(prefix="redox_oxidize_") as tmp:
-        in_path = Path(tmp) / "input.iron"
-        in_path.write_text(iron, encoding="utf-8")
-        cmd = [*redox_prefix, "oxidize", str(in_path)]
-        return subprocess.run(cmd, text=True, capture_output=True, check=False)
+def run_oxidize(redox: RedoxCommand, iron: bytes) -> subprocess.CompletedProcess[bytes]:
+    return run_redox_cached(redox, "oxidize", iron, "input.iron")
 
 
-def compile_rust_source(
-    rust_source: str, task_id: str
-) -> subprocess.CompletedProcess[str]:
-    with tempfile.TemporaryDirectory(prefix="redox_compile_") as tmp:
-        source_path = Path(tmp) / "roundtrip.rs"
-        source_path.write_text(rust_source, encoding="utf-8")
-
-        crate_name = sanitize_crate_name(task_id)
-        output_path = Path(tmp) / "out.rlib"
-
-        cmd = [
-            "rustc",
-            "--crate-name",
-            crate_name,
-            "--crate-type",
-            "lib",
-            "--edition",
-            "2024",
-            "-A",
-            "dead_code",
-            "-o",
-            str(output_path),
-            str(source_path),
-        ]
-        return subprocess.run(cmd, text=True, capture_output=True, check=False)
+def run_redox_cached(
+    redox: RedoxCommand, op: str, source: bytes, file_name: str
+) -> subprocess.CompletedProcess[bytes]:
+    key = (tuple(redox.prefix), op, hashlib.sha256(source).digest())
+    with _REDOX_CACHE_LOCK:
+        cached = _REDOX_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    proc = run_redox(redox, op, source, file_name)
+    with _REDOX_CACHE_LOCK:
+        _REDOX_CACHE[key] = proc
+    return proc
+
 
+def run_redox(
+    redox: RedoxCommand, op: str, source: bytes, file_name: str
+) -> subprocess.CompletedProcess[bytes]:
+    if redox.workers is not None:
+        served = redox.workers.request(op, source)
+        if served is not None:
+            return served
 
+    if redox.accepts_stdin:
+        cmd = [*redox.prefix, op, "-"]
+        return subprocess.run(cmd, input=source, capture_output=True, check=False)
+
+    # Older binaries only take a path argument.
+    in_path = scratch_dir() / file_name
+    in_path.write_bytes(source)
+    cmd = [*redox.prefix, op, str(in_path)]
+    return subprocess.run(cmd, capture_output=True, check=False)
+
+
+def compile_rust_source(
+    rust_source: bytes, task_id: str
+) -> subprocess.CompletedProcess[str]:
+    key = (sanitize_crate_name(task_id), hashlib.sha256(rust_source).hexdigest())
+    with _COMPILE_CACHE_LOCK:
+        cached = _COMPILE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    proc = run_rustc(rust_source, task_id)
+    with _COMPILE_CACHE_LOCK:
+        _COMPILE_CACHE[key] = proc
+    return proc
+
+
+def run_rustc(rust_source: bytes, task_id: str) -> subprocess.CompletedProcess[str]:
+    tmp = scratch_dir()
+    source_path = tmp / "roundtrip.rs"
+    source_path.write_bytes(rust_source)
+
+    crate_name = sanitize_crate_name(task_id)
+    output_path = tmp / "out.rmeta"
+
+    # Metadata-only output still runs type and borrow checking (like
+    # `cargo check`) but skips codegen, which dominates for tiny crates.
+    cmd = [
+        "rustc",
+        "--emit=metadata",
+        "--crate-name",
+        crate_name,
+        "--crate-type",
+        "lib",
+        "--edition",
+        "2024",
+        "-A",
+        "dead_code",
+        "-o",
+        str(output_path),
+        str(source_path),
+    ]
+    return subprocess.run(cmd, text=True, capture_output=True, check=False)
+
+
+@functools.lru_cache(maxsize=4096)
 def sanitize_crate_name(task_id: str) -> str:
-    name = re.sub(r"[^a-zA-Z0-9_]", "_", task_id)
+    name = _CRATE_NAME_INVALID_RE.sub("_", task_id)
     if not name:
         return "task"
     if name[0].isdigit():
@@ -394,6 +663,7 @@ def compute_gate_results(
     total = len(results)
     stable_count = sum(1 for r in results if r.reduce_ok and r.oxidize_ok)
     deterministic_count = sum(1 for r in results if r.reduce_deterministic)
+    determinism_checked_count = sum(1 for r in results if r.determinism_checked)
     compile_count = sum(1 for r in results if r.roundtrip_compile_ok)
     non_verbatim_count = sum(1 for r in results if not r.used_verbatim)
     purity = non_verbatim_count / total if total else 0.0
@@ -418,6 +688,7 @@ def compute_gate_results(
             "tasks_with_errors": per_task_errors,
             "stable_count": stable_count,
             "deterministic_count": deterministic_count,
+            "determinism_checked_count": determinism_checked_count,
             "compile_count": compile_count,
             "non_verbatim_count": non_verbatim_count,
             "purity_ratio": purity,
@@ -445,7 +716,19 @@ def print_report(
     print("Gate Results")
     print("------------")
     print(gate_line("Pipeline stability", gate_results["gate_pipeline_stability"]))
-    print(gate_line("Determinism", gate_results["gate_determinism"]))
+    # Unsampled tasks count as deterministic, so a sampled run must not
+    # read like a full check.
+    checked = stats["determinism_checked_count"]
+    total = stats["total_tasks"]
+    determinism_sampled = checked < total
+    print(
+        gate_line(
+            "Determinism",
+            gate_results["gate_determinism"],
+            f"{checked}/{total} checked" if determinism_sampled else None,
+            sampled=determinism_sampled,
+        )
+    )
     print(gate_line("Data quality", gate_results["gate_data_quality"]))
     purity_msg = (
         f"{stats['purity_ratio']:.3f} >= {purity_threshold:.3f}"
@@ -473,14 +756,21 @@ def print_report(
         print("All tasks passed per-task checks.")
 
     print("")
-    if gate_results["all_pass"]:
+    if gate_results["all_pass"] and determinism_sampled:
+        print("Overall: PASS (determinism sampled)")
+    elif gate_results["all_pass"]:
         print("Overall: PASS")
     else:
         print("Overall: FAIL")
 
 
-def gate_line(name: str, ok: bool, details: str | None = None) -> str:
-    marker = "PASS" if ok else "FAIL"
+def gate_line(
+    name: str, ok: bool, details: str | None = None, sampled: bool = False
+) -> str:
+    if not ok:
+        marker = "FAIL"
+    else:
+        marker = "SAMPLED" if sampled else "PASS"
     if details:
         return f"- {name}: {marker} ({details})"
     return f"- {name}: {marker}"
@@ -517,8 +807,10 @@ def write_report_json(
     output_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
 
 
-def single_line(text: str) -> str:
-    normalized = " ".join(text.strip().split())
+def single_line(text: str | bytes) -> str:
+    if isinstance(text, bytes):
+        text = text.decode("utf-8", errors="replace")
+    normalized = _WHITESPACE_RE.sub(" ", text).strip()
     if len(normalized) > 220:
         return normalized[:217] + "..."
     return normalized
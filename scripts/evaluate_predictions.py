@@ -4,13 +4,110 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+import contextlib
+import functools
 import json
+import os
 import re
+import shutil
 import subprocess
+import sys
 import tempfile
-from collections import Counter, defaultdict
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
+
+_PUB_FN_RE = re.compile(r"(?m)^\s*pub\s+fn\s+([A-Za-z_][A-Za-z0-9_]*)\s*\(")
+_FN_RE = re.compile(r"(?m)^\s*fn\s+([A-Za-z_][A-Za-z0-9_]*)\s*\(")
+_CLOSURE_SHIFT_PROMPT_RE = re.compile(r"adds\s+(\d+)\s+to\s+input")
+_UNWRAP_FALLBACK_PROMPT_RE = re.compile(r"returns\s+(\d+)\.")
+_VEC_POP_PROMPT_RE = re.compile(r"vec!\[(\d+),\s*(\d+),\s*(\d+)\]")
+_CRATE_NAME_INVALID_RE = re.compile(r"[^a-zA-Z0-9_]")
+# Source that resolves differently as a `#[path]` submodule than as a crate
+# root: `super`/`crate`-relative paths and visibility, inner (crate-level)
+# attributes, and out-of-line `mod foo;` declarations.
+_BATCH_UNSAFE_RE = re.compile(r"\bsuper\b|\bcrate\s*::|#!\s*\[|\bmod\s+\w+\s*;")
+_SUPPORTED_BEHAVIOR_FAMILIES = frozenset(
+    {"closure_shift_const", "result_unwrap_or_const", "vec_pop_basic"}
+)
+_SCRATCH = threading.local()
+
+# Sampled predictions often repeat verbatim. compile@1 results are keyed by
+# the transformed Rust source and behaviour results by (source, family,
+# prompt), so each distinct prediction only pays for rustc once per run.
+_COMPILE_CACHE: dict[str, tuple[bool, str]] = {}
+_BEHAVIOR_CACHE: dict[tuple[str, str, str], tuple[bool, str]] = {}
+_BEHAVIOR_CACHE_LOCK = threading.Lock()
+
+
+class RedoxWorker:
+    """One long-lived `redox serve` process answering oxidize requests."""
+
+    def __init__(self, redox_cmd: str) -> None:
+        self.cmd = [redox_cmd, "serve"]
+        self.proc = subprocess.Popen(
+            self.cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def request(self, op: str, source: bytes) -> tuple[bool, bytes]:
+        """Return (ok, body); body is the output on success, the error otherwise."""
+        assert self.proc.stdin is not None and self.proc.stdout is not None
+        self.proc.stdin.write(f"{op} {len(source)}\n".encode("ascii") + source)
+        self.proc.stdin.flush()
+
+        status, _, length = self.proc.stdout.readline().partition(b" ")
+        if status not in (b"ok", b"err") or not length.strip().isdigit():
+            raise RuntimeError(f"malformed response from {' '.join(self.cmd)}")
+        return status == b"ok", self.proc.stdout.read(int(length))
+
+    def close(self) -> None:
+        if self.proc.stdin is not None:
+            self.proc.stdin.close()
+        self.proc.wait()
+
+
+class RedoxWorkerPool:
+    """Hands each evaluation thread its own `RedoxWorker`."""
+
+    def __init__(self, redox_cmd: str) -> None:
+        self.redox_cmd = redox_cmd
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._workers: list[RedoxWorker] = []
+
+    def request(self, op: str, source: bytes) -> tuple[bool, bytes] | None:
+        """Run one request, or return None if the worker died and should be bypassed."""
+        worker = getattr(self._local, "worker", None)
+        if worker is None:
+            worker = RedoxWorker(self.redox_cmd)
+            self._local.worker = worker
+            with self._lock:
+                self._workers.append(worker)
+
+        try:
+            return worker.request(op, source)
+        except (OSError, RuntimeError):
+            # A crashed or desynced worker is replaced on the next request.
+            self._local.worker = None
+            worker.proc.kill()
+            return None
+
+    def close(self) -> None:
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            try:
+                worker.close()
+            except OSError:
+                worker.proc.kill()
 
 
 def parse_args() -> argparse.Namespace:
@@ -29,57 +126,270 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--out", type=Path, default=None, help="Optional output report JSON"
     )
+    parser.add_argument(
+        "--rows-out",
+        type=Path,
+        default=None,
+        help="Per-row results JSONL (default: next to --out as <name>.rows.jsonl)",
+    )
+    parser.add_argument(
+        "--compile-batch-size",
+        type=int,
+        default=16,
+        help="Predictions per batched compile@1 rustc run (default: 16; 1 disables)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of predictions to evaluate concurrently (default: CPU count)",
+    )
     return parser.parse_args()
 
 
+def scratch_root() -> str | None:
+    """Pick where per-call scratch files go.
+
+    `REDOX_EVAL_TMPDIR` wins when set; otherwise RAM-backed /dev/shm is used
+    when writable, so rustc inputs and artifacts never hit disk. behavior_test
+    runs the binaries it builds from there, so a noexec /dev/shm (Docker's
+    default) is skipped. None means the tempfile default.
+    """
+    override = os.environ.get("REDOX_EVAL_TMPDIR")
+    if override:
+        return override
+    if os.access("/dev/shm", os.W_OK):
+        try:
+            noexec = os.statvfs("/dev/shm").f_flag & os.ST_NOEXEC
+        except OSError:
+            noexec = True
+        if not noexec:
+            return "/dev/shm"
+    return None
+
+
+def scratch_dir() -> Path:
+    """Return this thread's scratch directory, created once and reused per call.
+
+    Each evaluation thread runs its subprocesses sequentially, and every stage
+    writes its own fixed file names, so nothing inside the directory collides.
+    """
+    path = getattr(_SCRATCH, "path", None)
+    if path is None:
+        path = Path(tempfile.mkdtemp(prefix="redox_eval_", dir=scratch_root()))
+        atexit.register(shutil.rmtree, path, ignore_errors=True)
+        _SCRATCH.path = path
+    return path
+
+
+def write_scratch_file(path: Path, text: str) -> None:
+    """Write a small scratch input with raw os calls.
+
+    Skips the buffered text-file stack that `Path.write_text` sets up, which
+    costs more than the write itself for a few KB of source.
+    """
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
+def supports_serve(redox_cmd: str) -> bool:
+    """Return True if the redox binary understands the `serve` subcommand."""
+    try:
+        probe = subprocess.run(
+            [redox_cmd, "serve"], input=b"", capture_output=True, check=False
+        )
+    except OSError:
+        return False
+    return probe.returncode == 0
+
+
 def read_jsonl(path: Path) -> list[dict[str, Any]]:
     rows: list[dict[str, Any]] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if line.strip():
-            rows.append(json.loads(line))
+    with path.open("rb") as f:
+        for line in f:
+            if line.strip():
+                rows.append(json.loads(line))
     return rows
 
 
-def oxidize_iron(prediction: str, redox_cmd: str) -> tuple[bool, str, str]:
-    with tempfile.TemporaryDirectory(prefix="redox_eval_iron_") as tmp:
-        iron_path = Path(tmp) / "input.iron"
-        iron_path.write_text(prediction, encoding="utf-8")
-        proc = subprocess.run(
-            [redox_cmd, "oxidize", str(iron_path)],
-            text=True,
-            capture_output=True,
-            check=False,
-        )
-        if proc.returncode != 0:
-            return False, "", compact(proc.stderr)
-        return True, proc.stdout, ""
+def oxidize_iron(
+    prediction: str, redox_cmd: str, workers: RedoxWorkerPool | None = None
+) -> tuple[bool, str, str]:
+    if workers is not None:
+        response = workers.request("oxidize", prediction.encode("utf-8"))
+        if response is not None:
+            ok, body = response
+            text = body.decode("utf-8", errors="replace")
+            if not ok:
+                # Same text the one-shot CLI prints for a failed oxidize.
+                return False, "", compact(f"Error: {text}\n")
+            return True, text, ""
+
+    iron_path = scratch_dir() / "input.iron"
+    write_scratch_file(iron_path, prediction)
+    proc = subprocess.run(
+        [redox_cmd, "oxidize", str(iron_path)],
+        text=True,
+        capture_output=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        return False, "", compact(proc.stderr)
+    return True, proc.stdout, ""
 
 
 def compile_rust(source: str, crate_name: str) -> tuple[bool, str]:
-    with tempfile.TemporaryDirectory(prefix="redox_eval_compile_") as tmp:
-        src = Path(tmp) / "pred.rs"
-        out = Path(tmp) / "pred.rlib"
-        src.write_text(source, encoding="utf-8")
-        proc = subprocess.run(
-            [
-                "rustc",
-                "--crate-name",
-                sanitize_crate_name(crate_name),
-                "--crate-type",
-                "lib",
-                "--edition",
-                "2024",
-                "-A",
-                "dead_code",
-                "-o",
-                str(out),
-                str(src),
-            ],
-            text=True,
-            capture_output=True,
-            check=False,
-        )
-        return proc.returncode == 0, compact(proc.stderr)
+    tmp = scratch_dir()
+    src = tmp / "pred.rs"
+    out = tmp / "pred.rmeta"
+    write_scratch_file(src, source)
+    # compile@1 only needs type and borrow checking (like `cargo check`);
+    # metadata-only output skips codegen. behavior_test still links.
+    proc = subprocess.run(
+        [
+            "rustc",
+            "--emit=metadata",
+            "--crate-name",
+            sanitize_crate_name(crate_name),
+            "--crate-type",
+            "lib",
+            "--edition",
+            "2024",
+            "-A",
+            "dead_code",
+            "-o",
+            str(out),
+            str(src),
+        ],
+        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=False,
+    )
+    return proc.returncode == 0, compact(proc.stderr)
+
+
+def compile_rust_batch(items: list[tuple[str, str]]) -> list[tuple[bool, str]]:
+    """Compile several (source, crate_name) predictions with one rustc run.
+
+    Each prediction becomes a `#[path]` file module of one synthetic crate, so
+    its braces stay scoped to its own file. Only predictions that
+    `batch_eligible` accepts go into the batch; the rest compile alone, since
+    a submodule can accept code (`pub(super)`, `super::`) that fails as a
+    crate root and the synthetic crate hides crate-level lints. A prediction
+    only takes its result from the batch when rustc said nothing about it and
+    nothing failed; predictions with diagnostics are recompiled alone so their
+    reported text matches a single compile exactly. Errors can stop rustc
+    before later phases reach other modules, so after a failing batch the
+    remaining predictions are re-batched without the failing ones.
+    """
+    eligible = [i for i, item in enumerate(items) if batch_eligible(*item)]
+    if len(eligible) < len(items):
+        outcomes = dict(zip(eligible, compile_rust_batch([items[i] for i in eligible])))
+        return [
+            outcomes[i] if i in outcomes else compile_rust(source, name)
+            for i, (source, name) in enumerate(items)
+        ]
+    if len(items) <= 1:
+        return [compile_rust(source, name) for source, name in items]
+
+    tmp = scratch_dir()
+    root = tmp / "batch.rs"
+    mods = []
+    for i, (source, _) in enumerate(items):
+        write_scratch_file(tmp / f"pred_{i}.rs", source)
+        mods.append(f'#[path = "pred_{i}.rs"]\npub mod pred_{i};\n')
+    write_scratch_file(root, "".join(mods))
+    proc = subprocess.run(
+        [
+            "rustc",
+            "--emit=metadata",
+            "--error-format=json",
+            "--crate-name",
+            "redox_eval_batch",
+            "--crate-type",
+            "lib",
+            "--edition",
+            "2024",
+            "-A",
+            "dead_code",
+            "-o",
+            str(tmp / "batch.rmeta"),
+            str(root),
+        ],
+        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=False,
+    )
+
+    file_names = {f"pred_{i}.rs": i for i in range(len(items))}
+    diagnosed = diagnostic_levels_by_file(proc.stderr)
+    if diagnosed is None or not diagnosed.keys() <= file_names.keys():
+        return [compile_rust(source, name) for source, name in items]
+
+    failing = {file_names[f] for f, levels in diagnosed.items() if "error" in levels}
+    if proc.returncode != 0 and not failing:
+        return [compile_rust(source, name) for source, name in items]
+
+    if proc.returncode != 0:
+        rest = [i for i in range(len(items)) if i not in failing]
+        outcomes = dict(zip(rest, compile_rust_batch([items[i] for i in rest])))
+    else:
+        outcomes = {i: (True, "") for f, i in file_names.items() if f not in diagnosed}
+    return [
+        outcomes[i] if i in outcomes else compile_rust(source, name)
+        for i, (source, name) in enumerate(items)
+    ]
+
+
+def batch_eligible(source: str, crate_name: str) -> bool:
+    """Return True if a prediction compiles the same as a batch submodule.
+
+    Rejects source that `_BATCH_UNSAFE_RE` flags and crate names rustc would
+    warn about (`non_snake_case`), since that warning only appears when the
+    prediction is its own crate.
+    """
+    if _BATCH_UNSAFE_RE.search(source):
+        return False
+    name = sanitize_crate_name(crate_name).strip("_")
+    return "__" not in name and name == name.lower()
+
+
+def diagnostic_levels_by_file(stderr: str) -> dict[str, set[str]] | None:
+    """Map file names to the levels of rustc JSON diagnostics pointing at them.
+
+    Returns None when a diagnostic cannot be tied to a file, other than the
+    trailing summaries ("aborting due to ...", "N warnings emitted", notes).
+    """
+    levels: dict[str, set[str]] = {}
+    for line in stderr.splitlines():
+        if not line.strip():
+            continue
+        try:
+            diagnostic = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+        level = diagnostic.get("level", "")
+        message = diagnostic.get("message", "")
+        spans = [span for span in diagnostic.get("spans", []) if span["is_primary"]]
+        if spans:
+            for span in spans:
+                levels.setdefault(Path(span["file_name"]).name, set()).add(
+                    "error" if level.startswith("error") else level
+                )
+        elif not (
+            level == "failure-note"
+            or (level == "warning" and message.endswith("emitted"))
+            or (level == "error" and message.startswith("aborting due to"))
+        ):
+            return None
+    return levels
 
 
 def behavior_test(
@@ -90,53 +400,60 @@ def behavior_test(
     fn_name = extract_function_name(source)
     if fn_name is None:
         return False, "No function definition found"
+    if family not in _SUPPORTED_BEHAVIOR_FAMILIES:
+        return False, f"Unsupported family for behavior checks: {family}"
+
+    # The prompt parse is cheap and decides whether there is anything to
+    # build, so it runs before any scratch file is written.
+    test_code = build_behavior_program(source, fn_name, family, prompt)
+    if test_code is None:
+        return False, f"Unsupported family for behavior checks: {family}"
+
+    tmp = scratch_dir()
+    src = tmp / "behavior.rs"
+    out = tmp / "behavior_bin"
+    write_scratch_file(src, test_code)
+    proc = subprocess.run(
+        [
+            "rustc",
+            "--crate-name",
+            sanitize_crate_name(crate_name + "_behavior"),
+            "--edition",
+            "2024",
+            "-A",
+            "dead_code",
+            "-o",
+            str(out),
+            str(src),
+        ],
+        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=False,
+    )
+    if proc.returncode != 0:
+        return False, compact(proc.stderr)
 
-    with tempfile.TemporaryDirectory(prefix="redox_eval_behavior_") as tmp:
-        src = Path(tmp) / "behavior.rs"
-        out = Path(tmp) / "behavior_bin"
-
-        test_code = build_behavior_program(source, fn_name, family, prompt)
-        if test_code is None:
-            return False, f"Unsupported family for behavior checks: {family}"
-
-        src.write_text(test_code, encoding="utf-8")
-        proc = subprocess.run(
-            [
-                "rustc",
-                "--crate-name",
-                sanitize_crate_name(crate_name + "_behavior"),
-                "--edition",
-                "2024",
-                "-A",
-                "dead_code",
-                "-o",
-                str(out),
-                str(src),
-            ],
-            text=True,
-            capture_output=True,
-            check=False,
-        )
-        if proc.returncode != 0:
-            return False, compact(proc.stderr)
-
+    try:
         run = subprocess.run([str(out)], text=True, capture_output=True, check=False)
-        if run.returncode != 0:
-            return False, compact(run.stderr or run.stdout)
+    except OSError as exc:
+        # The scratch filesystem refused to execute the binary; that says
+        # nothing about the prediction.
+        return False, compact(f"infrastructure error: could not run {out}: {exc}")
+    if run.returncode != 0:
+        return False, compact(run.stderr or run.stdout)
 
     return True, ""
 
 
 def extract_function_name(source: str) -> str | None:
-    pub_matches = re.findall(
-        r"(?m)^\s*pub\s+fn\s+([A-Za-z_][A-Za-z0-9_]*)\s*\(", source
-    )
-    if pub_matches:
-        return pub_matches[0]
+    pub_match = _PUB_FN_RE.search(source)
+    if pub_match:
+        return pub_match.group(1)
 
-    any_matches = re.findall(r"(?m)^\s*fn\s+([A-Za-z_][A-Za-z0-9_]*)\s*\(", source)
-    if any_matches:
-        return any_matches[0]
+    any_match = _FN_RE.search(source)
+    if any_match:
+        return any_match.group(1)
 
     return None
 
@@ -145,7 +462,7 @@ def build_behavior_program(
     source: str, fn_name: str, family: str, prompt: str
 ) -> str | None:
     if family == "closure_shift_const":
-        m = re.search(r"adds\s+(\d+)\s+to\s+input", prompt)
+        m = _CLOSURE_SHIFT_PROMPT_RE.search(prompt)
         if not m:
             return None
         k = int(m.group(1))
@@ -158,7 +475,7 @@ def build_behavior_program(
         )
 
     if family == "result_unwrap_or_const":
-        m = re.search(r"returns\s+(\d+)\.", prompt)
+        m = _UNWRAP_FALLBACK_PROMPT_RE.search(prompt)
         if not m:
             return None
         fallback = int(m.group(1))
@@ -173,7 +490,7 @@ def build_behavior_program(
         )
 
     if family == "vec_pop_basic":
-        m = re.search(r"vec!\[(\d+),\s*(\d+),\s*(\d+)\]", prompt)
+        m = _VEC_POP_PROMPT_RE.search(prompt)
         if not m:
             return None
         expected = int(m.group(3))
@@ -189,75 +506,171 @@ def build_behavior_program(
 
 
 def evaluate_arm(
-    rows: list[dict[str, Any]], arm: str, redox_cmd: str
+    rows: list[dict[str, Any]],
+    arm: str,
+    redox_cmd: str,
+    jobs: int = 1,
+    compile_batch_size: int = 1,
+    workers: RedoxWorkerPool | None = None,
+    rows_out: IO[str] | None = None,
 ) -> dict[str, Any]:
-    results = []
-    for row in rows:
-        task_id = row.get("id", "unknown")
-        pred = row.get("prediction", "")
-        family = row.get("family", "")
-
-        transform_ok = True
-        rust_code = pred
-        transform_error = ""
-
-        if arm == "iron":
-            transform_ok, rust_code, transform_error = oxidize_iron(pred, redox_cmd)
-
-        compile_ok = False
-        compile_error = ""
-        if transform_ok:
-            compile_ok, compile_error = compile_rust(rust_code, f"{arm}_{task_id}")
-
-        test_ok = False
-        test_error = ""
-        if compile_ok:
-            test_ok, test_error = behavior_test(rust_code, row, f"{arm}_{task_id}")
-
-        results.append(
-            {
-                "id": task_id,
-                "family": family,
-                "arm": arm,
-                "transform_ok": transform_ok,
-                "compile_ok": compile_ok,
-                "test_ok": test_ok,
-                "transform_error": transform_error,
-                "compile_error": compile_error,
-                "test_error": test_error,
-            }
+    # Rows are independent and dominated by redox/rustc subprocess waits, so
+    # threads are enough to overlap them; map() keeps results in row order.
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        transformed = list(
+            executor.map(lambda row: transform_row(row, arm, redox_cmd, workers), rows)
         )
 
+        pending = [i for i, (ok, _, _) in enumerate(transformed) if ok]
+        first_seen: dict[str, int] = {}
+        for i in pending:
+            if transformed[i][1] not in _COMPILE_CACHE:
+                first_seen.setdefault(transformed[i][1], i)
+        unique = list(first_seen.values())
+        batches = [
+            unique[start : start + compile_batch_size]
+            for start in range(0, len(unique), compile_batch_size)
+        ]
+        batch_outcomes = executor.map(
+            lambda batch: compile_rust_batch(
+                [(transformed[i][1], crate_label(rows[i], arm)) for i in batch]
+            ),
+            batches,
+        )
+        for batch, outcomes in zip(batches, batch_outcomes):
+            for i, outcome in zip(batch, outcomes):
+                _COMPILE_CACHE[transformed[i][1]] = outcome
+        compiled: list[tuple[bool, str]] = [(False, "")] * len(rows)
+        for i in pending:
+            compiled[i] = _COMPILE_CACHE[transformed[i][1]]
+
+        results = []
+        for result in executor.map(
+            lambda row, t, c: finish_row(row, arm, t, c),
+            rows,
+            transformed,
+            compiled,
+        ):
+            if rows_out is not None:
+                rows_out.write(json.dumps(result, separators=(",", ":")) + "\n")
+            results.append(result)
+
     return summarize_results(results, arm)
 
 
+def crate_label(row: dict[str, Any], arm: str) -> str:
+    return f"{arm}_{row.get('id', 'unknown')}"
+
+
+def transform_row(
+    row: dict[str, Any],
+    arm: str,
+    redox_cmd: str,
+    workers: RedoxWorkerPool | None = None,
+) -> tuple[bool, str, str]:
+    """Return (ok, rust_code, error) for a prediction, oxidizing Iron rows."""
+    pred = row.get("prediction", "")
+    if arm == "iron":
+        return oxidize_iron(pred, redox_cmd, workers)
+    return True, pred, ""
+
+
+def finish_row(
+    row: dict[str, Any],
+    arm: str,
+    transformed: tuple[bool, str, str],
+    compiled: tuple[bool, str],
+) -> dict[str, Any]:
+    transform_ok, rust_code, transform_error = transformed
+    compile_ok, compile_error = compiled
+
+    test_ok = False
+    test_error = ""
+    if compile_ok:
+        key = (rust_code, row.get("family", ""), row.get("prompt", ""))
+        with _BEHAVIOR_CACHE_LOCK:
+            cached = _BEHAVIOR_CACHE.get(key)
+        if cached is None:
+            cached = behavior_test(rust_code, row, crate_label(row, arm))
+            with _BEHAVIOR_CACHE_LOCK:
+                _BEHAVIOR_CACHE[key] = cached
+        test_ok, test_error = cached
+
+    return {
+        "id": row.get("id", "unknown"),
+        "family": row.get("family", ""),
+        "arm": arm,
+        "transform_ok": transform_ok,
+        "compile_ok": compile_ok,
+        "test_ok": test_ok,
+        "transform_error": transform_error,
+        "compile_error": compile_error,
+        "test_error": test_error,
+    }
+
+
+# Each alternative is a zero-width lookahead anchored at the start of the
+# text, so alternatives are tried in priority order (not by leftmost match)
+# and each classification is a single case-insensitive regex call.
+_TRANSFORM_ERROR_CLASS_RE = re.compile(
+    r"""
+    \A(?:
+        (?=.*?(?:unexpectedtoken|parse\ error))(?P<iron_parse_error>)
+      | (?=.*?oxidation\ failed)(?P<oxidation_error>)
+    )
+    """,
+    re.DOTALL | re.IGNORECASE | re.VERBOSE,
+)
+_ERROR_CLASS_RE = re.compile(
+    r"""
+    \A(?:
+        (?=.*?(?:infrastructure\ error|no\ space\ left\ on\ device))(?P<infrastructure_error>)
+      | (?=.*?(?:expected\ value,\ found\ crate|cannot\ find))(?P<name_resolution>)
+      | (?=.*?this\ function\ takes)(?=.*?argument)(?P<wrong_signature_or_call>)
+      | (?=.*?mismatched\ types)(?P<type_mismatch>)
+      | (?=.*?(?:unexpectedtoken|parse\ error))(?P<parse_error>)
+      | (?=.*?no\ function\ definition\ found)(?P<missing_function>)
+      | (?=.*?assertion\ failed)(?P<behavior_assertion>)
+    )
+    """,
+    re.DOTALL | re.IGNORECASE | re.VERBOSE,
+)
+
+
 def classify_error(message: str, phase: str) -> str:
-    text = message.lower()
-    if not text:
+    if not message:
         return "none"
 
     if phase == "transform":
-        if "unexpectedtoken" in text or "parse error" in text:
-            return "iron_parse_error"
-        if "oxidation failed" in text:
-            return "oxidation_error"
-        return "transform_other"
-
-    if "expected value, found crate" in text:
-        return "name_resolution"
-    if "cannot find" in text:
-        return "name_resolution"
-    if "this function takes" in text and "argument" in text:
-        return "wrong_signature_or_call"
-    if "mismatched types" in text:
-        return "type_mismatch"
-    if "unexpectedtoken" in text or "parse error" in text:
-        return "parse_error"
-    if "no function definition found" in text:
-        return "missing_function"
-    if "assertion failed" in text:
-        return "behavior_assertion"
-    return "other"
+        match = _TRANSFORM_ERROR_CLASS_RE.match(message)
+        if match is None:
+            return "transform_other"
+        return match.lastgroup or "transform_other"
+
+    match = _ERROR_CLASS_RE.match(message)
+    if match is None:
+        return "other"
+    return match.lastgroup or "other"
+
+
+def failure_phase(row: dict[str, Any]) -> str | None:
+    """Return the first phase a row failed in, if any."""
+    if not row["transform_ok"]:
+        return "transform"
+    if not row["compile_ok"]:
+        return "compile"
+    if not row["test_ok"]:
+        return "test"
+    return None
+
+
+def row_outcome(row: dict[str, Any]) -> tuple[str, bool, bool, str | None, str | None]:
+    """Reduce a row to (family, compile_ok, test_ok, failure phase, failure label)."""
+    phase = failure_phase(row)
+    if phase is None:
+        return row["family"], row["compile_ok"], row["test_ok"], None, None
+    label = classify_error(row.get(f"{phase}_error", ""), phase)
+    return row["family"], row["compile_ok"], row["test_ok"], phase, label
 
 
 def summarize_results(results: list[dict[str, Any]], arm: str) -> dict[str, Any]:
@@ -266,43 +679,34 @@ def summarize_results(results: list[dict[str, Any]], arm: str) -> dict[str, Any]
     compile_pass = sum(1 for r in results if r["compile_ok"])
     test_pass = sum(1 for r in results if r["test_ok"])
 
-    per_family: dict[str, dict[str, int]] = defaultdict(
-        lambda: {"total": 0, "compile": 0, "test": 0}
-    )
-    failure_phase_counts: Counter[str] = Counter()
-    failure_taxonomy: Counter[str] = Counter()
-    per_family_failure_phase_counts: dict[str, Counter[str]] = defaultdict(Counter)
-    per_family_failure_taxonomy: dict[str, Counter[str]] = defaultdict(Counter)
-
-    for r in results:
-        fam = r["family"]
-        per_family[fam]["total"] += 1
-        if r["compile_ok"]:
-            per_family[fam]["compile"] += 1
-        if r["test_ok"]:
-            per_family[fam]["test"] += 1
-
-        if not r["transform_ok"]:
-            phase = "transform"
-            label = classify_error(r.get("transform_error", ""), "transform")
-            failure_phase_counts["transform"] += 1
-            failure_taxonomy[label] += 1
-            per_family_failure_phase_counts[fam][phase] += 1
-            per_family_failure_taxonomy[fam][label] += 1
-        elif not r["compile_ok"]:
-            phase = "compile"
-            label = classify_error(r.get("compile_error", ""), "compile")
-            failure_phase_counts["compile"] += 1
-            failure_taxonomy[label] += 1
-            per_family_failure_phase_counts[fam][phase] += 1
-            per_family_failure_taxonomy[fam][label] += 1
-        elif not r["test_ok"]:
-            phase = "test"
-            label = classify_error(r.get("test_error", ""), "test")
-            failure_phase_counts["test"] += 1
-            failure_taxonomy[label] += 1
-            per_family_failure_phase_counts[fam][phase] += 1
-            per_family_failure_taxonomy[fam][label] += 1
+    # One pass reduces every row to a tuple; each tally below is then a
+    # Counter over those tuples rather than per-row nested dict updates.
+    outcomes = [row_outcome(r) for r in results]
+    family_totals = Counter(fam for fam, _, _, _, _ in outcomes)
+    family_compile = Counter(fam for fam, ok, _, _, _ in outcomes if ok)
+    family_test = Counter(fam for fam, _, ok, _, _ in outcomes if ok)
+    per_family = {
+        fam: {"total": count, "compile": family_compile[fam], "test": family_test[fam]}
+        for fam, count in family_totals.items()
+    }
+
+    failures = [
+        (fam, phase, label) for fam, _, _, phase, label in outcomes if phase is not None
+    ]
+    failure_phase_counts = Counter(phase for _, phase, _ in failures)
+    failure_taxonomy = Counter(label for _, _, label in failures)
+
+    # The sort is stable, so each family keeps its failures in row order.
+    by_family = [
+        (fam, list(group))
+        for fam, group in groupby(sorted(failures, key=itemgetter(0)), itemgetter(0))
+    ]
+    per_family_failure_phase_counts = {
+        fam: Counter(phase for _, phase, _ in group) for fam, group in by_family
+    }
+    per_family_failure_taxonomy = {
+        fam: Counter(label for _, _, label in group) for fam, group in by_family
+    }
 
     return {
         "arm": arm,
@@ -323,12 +727,12 @@ def summarize_results(results: list[dict[str, Any]], arm: str) -> dict[str, Any]
             family: dict(counts.most_common())
             for family, counts in sorted(per_family_failure_taxonomy.items())
         },
-        "rows": results,
     }
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_crate_name(value: str) -> str:
-    name = re.sub(r"[^a-zA-Z0-9_]", "_", value)
+    name = _CRATE_NAME_INVALID_RE.sub("_", value)
     if not name:
         return "pred"
     if name[0].isdigit():
@@ -389,23 +793,75 @@ def print_summary(report: dict[str, Any]) -> None:
 
 def main() -> int:
     args = parse_args()
+    if args.jobs < 1:
+        print("ERROR: --jobs must be at least 1", file=sys.stderr)
+        return 2
+    if args.compile_batch_size < 1:
+        print("ERROR: --compile-batch-size must be at least 1", file=sys.stderr)
+        return 2
+
     rust_rows = read_jsonl(args.rust)
     iron_rows = read_jsonl(args.iron)
 
-    rust_report = evaluate_arm(rust_rows, "rust", args.redox_cmd)
-    iron_report = evaluate_arm(iron_rows, "iron", args.redox_cmd)
+    rows_out = args.rows_out
+    if rows_out is None and args.out is not None:
+        rows_out = args.out.with_suffix(".rows.jsonl")
+
+    # Row-level detail goes to an NDJSON sidecar as each row finishes, so the
+    # summary report only carries aggregates.
+    with (
+        rows_out.open("w", encoding="utf-8")
+        if rows_out is not None
+        else contextlib.nullcontext()
+    ) as rows_file:
+        rust_report = evaluate_arm(
+            rust_rows,
+            "rust",
+            args.redox_cmd,
+            args.jobs,
+            args.compile_batch_size,
+            rows_out=rows_file,
+        )
+        # Only the Iron arm calls redox; one `serve` process per thread avoids
+        # a fork/exec per prediction. Older binaries fall back to one-shot
+        # oxidize.
+        workers = (
+            RedoxWorkerPool(args.redox_cmd) if supports_serve(args.redox_cmd) else None
+        )
+        try:
+            iron_report = evaluate_arm(
+                iron_rows,
+                "iron",
+                args.redox_cmd,
+                args.jobs,
+                args.compile_batch_size,
+                workers,
+                rows_file,
+            )
+        finally:
+            if workers is not None:
+                workers.close()
 
-    report = {
+    report: dict[str, Any] = {
         "inputs": {"rust": str(args.rust), "iron": str(args.iron)},
-        "rust": rust_report,
-        "iron": iron_report,
     }
+    if rows_out is not None and args.out is not None:
+        # Relative to the report so the pair can be moved together.
+        report["rows_file"] = os.path.relpath(rows_out, args.out.parent)
+    report["rust"] = rust_report
+    report["iron"] = iron_report
 
     print_summary(report)
 
     if args.out is not None:
-        args.out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        # Stream the encoder's chunks to the file rather than building the
+        # whole indented document (every row included) as one string first.
+        with args.out.open("w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
         print(f"Wrote report: {args.out}")
+    if rows_out is not None:
+        print(f"Wrote rows: {rows_out}")
 
     return 0
 
@@ -4,14 +4,25 @@
 from __future__ import annotations
 
 import argparse
-import csv
+import contextlib
+import functools
 import json
+import os
+import re
 import sys
-from collections import Counter, defaultdict
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+_JSONL_BATCH_LINES = 4096
+_CSV_SPECIAL_CHARS = frozenset(',"\r\n')
+_CSV_QUOTE_RE = re.compile(r'["\r\n]')
+
 
 @dataclass(frozen=True)
 class RunSpec:
@@ -40,6 +51,7 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+@functools.lru_cache(maxsize=8192)
 def r6(value: float) -> float:
     return round(float(value), 6)
 
@@ -87,56 +99,176 @@ def build_run_specs(repo_root: Path) -> list[RunSpec]:
     ]
 
 
+@functools.lru_cache(maxsize=None)
 def load_json(path: Path) -> dict[str, Any]:
+    # Cached per path: the v2.6 seed reports feed both the seed metrics and
+    # the failure rows. Callers must treat the result as read-only.
     return json.loads(path.read_text(encoding="utf-8"))
 
 
+def load_report_rows(
+    report_path: Path, data: dict[str, Any], arm: str
+) -> list[dict[str, Any]]:
+    """Return one arm's per-row results, inline or from the report's sidecar."""
+    rows_file = data.get("rows_file")
+    if rows_file is None:
+        return data[arm].get("rows", [])
+    return [
+        row for row in load_jsonl(report_path.parent / rows_file) if row["arm"] == arm
+    ]
+
+
 def load_jsonl(path: Path) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if line.strip():
-            rows.append(json.loads(line))
-    return rows
+    # Stream the file and parse it in fixed-size batches, so raw text held
+    # at once is bounded by the batch rather than the whole file.
+    records: list[dict[str, Any]] = []
+    with path.open("rb") as f:
+        lines = (line for line in f if line.strip())
+        while batch := list(islice(lines, _JSONL_BATCH_LINES)):
+            records.extend(parse_json_lines(batch))
+    return records
+
+
+def parse_json_lines(lines: list[bytes]) -> list[Any]:
+    """Parse non-blank JSONL lines with one decoder call over a wrapped array.
+
+    Falls back to parsing each line on its own when the wrapped document is
+    invalid or the record count does not match, so bad input raises the same
+    error as before.
+    """
+    try:
+        records = json.loads(b"[" + b",".join(lines) + b"]")
+    except json.JSONDecodeError:
+        records = None
+    if records is None or len(records) != len(lines):
+        records = [json.loads(line) for line in lines]
+    return records
+
+
+def csv_field(value: Any) -> str:
+    """Format one value the way csv.writer's excel dialect does."""
+    if value is None:
+        return ""
+    text = str(value)
+    if any(c in text for c in _CSV_SPECIAL_CHARS):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def csv_line(values: tuple[Any, ...]) -> str:
+    """Render one CSV record exactly as csv.writer's excel dialect would."""
+    if None not in values:
+        line = ",".join(map(str, values))
+        # One scan of the joined line covers the common case where no field
+        # needs quoting; anything else takes the per-field path.
+        if (
+            line
+            and line.count(",") == len(values) - 1
+            and not _CSV_QUOTE_RE.search(line)
+        ):
+            return line + "\r\n"
+    line = ",".join(map(csv_field, values))
+    # A lone empty field is quoted so the record is not a blank line.
+    return (line or '""') + "\r\n"
+
+
+class CSVSink:
+    """A CSV file written incrementally: header on open, rows as they arrive.
+
+    Rows go to a `.tmp` sibling; `publish` moves it over the real path, so
+    a run that fails partway leaves the previous table untouched.
+    """
+
+    def __init__(self, path: Path, fieldnames: list[str]) -> None:
+        self.path = path
+        self.fieldnames = fieldnames
+        self._get_values = itemgetter(*fieldnames)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp_path = path.with_name(path.name + ".tmp")
+        # A 1 MiB buffer turns a large table into a handful of write() calls.
+        self._file = self._tmp_path.open(
+            "w", encoding="utf-8", newline="", buffering=1 << 20
+        )
+        self._file.write(csv_line(tuple(fieldnames)))
+
+    def __enter__(self) -> CSVSink:
+        return self
 
+    def __exit__(self, exc_type: object, *exc_info: object) -> None:
+        self.close()
+        if exc_type is not None:
+            self._tmp_path.unlink(missing_ok=True)
 
-def write_csv(path: Path, fieldnames: list[str], rows: list[dict[str, Any]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    def write_row(self, row: dict[str, Any]) -> None:
+        self.write_rows((row,))
+
+    def write_rows(self, rows: Iterable[dict[str, Any]]) -> None:
+        get_values = self._get_values
+        if len(self.fieldnames) == 1:
+            self.write_records((get_values(row),) for row in rows)
+        else:
+            self.write_records(map(get_values, rows))
+
+    def write_columns(self, columns: dict[str, list[Any]]) -> None:
+        """Write a table held as one list per field, zipping the columns into rows."""
+        self.write_records(zip(*(columns[name] for name in self.fieldnames)))
+
+    def write_records(self, records: Iterable[tuple[Any, ...]]) -> None:
+        # Fields are almost all numbers and identifiers, so joining them
+        # directly beats DictWriter's per-field dialect handling.
+        self._file.writelines(map(csv_line, records))
+
+    def close(self) -> None:
+        self._file.close()
+
+    def publish(self) -> None:
+        os.replace(self._tmp_path, self.path)
+
+
+def extend_run_columns(
+    columns: dict[str, list[Any]], spec: RunSpec, arm: str, count: int
+) -> None:
+    # The run identity is the same for every row of an arm, so it is
+    # repeated in bulk rather than appended row by row.
+    columns["run_key"].extend([spec.key] * count)
+    columns["run_label"].extend([spec.label] * count)
+    columns["report_path"].extend([spec.report_path.as_posix()] * count)
+    columns["arm"].extend([arm] * count)
 
 
 def summarize_run(spec: RunSpec, data: dict[str, Any]) -> dict[str, Any]:
     if spec.kind == "aggregate":
-        rust = data["summary"]["rust"]
-        iron = data["summary"]["iron"]
-
-        row = {
+        summary = data["summary"]
+        rust = summary["rust"]
+        iron = summary["iron"]
+        rust_compile = rust["compile_at_1"]
+        rust_test = rust["test_at_1"]
+        rust_transform = rust["transform_rate"]
+        iron_compile = iron["compile_at_1"]
+        iron_test = iron["test_at_1"]
+        iron_transform = iron["transform_rate"]
+        delta = data["delta_iron_minus_rust"]
+
+        return {
             "run_key": spec.key,
             "run_label": spec.label,
             "report_path": spec.report_path.as_posix(),
             "num_reports": int(data.get("num_reports", 1)),
-            "rust_compile_at_1_mean": r6(rust["compile_at_1"]["mean"]),
-            "rust_compile_at_1_std": r6(rust["compile_at_1"].get("std", 0.0)),
-            "rust_test_at_1_mean": r6(rust["test_at_1"]["mean"]),
-            "rust_test_at_1_std": r6(rust["test_at_1"].get("std", 0.0)),
-            "rust_transform_rate_mean": r6(rust["transform_rate"]["mean"]),
-            "rust_transform_rate_std": r6(rust["transform_rate"].get("std", 0.0)),
-            "iron_compile_at_1_mean": r6(iron["compile_at_1"]["mean"]),
-            "iron_compile_at_1_std": r6(iron["compile_at_1"].get("std", 0.0)),
-            "iron_test_at_1_mean": r6(iron["test_at_1"]["mean"]),
-            "iron_test_at_1_std": r6(iron["test_at_1"].get("std", 0.0)),
-            "iron_transform_rate_mean": r6(iron["transform_rate"]["mean"]),
-            "iron_transform_rate_std": r6(iron["transform_rate"].get("std", 0.0)),
-            "delta_iron_minus_rust_compile": r6(
-                data["delta_iron_minus_rust"]["compile_at_1_mean"]
-            ),
-            "delta_iron_minus_rust_test": r6(
-                data["delta_iron_minus_rust"]["test_at_1_mean"]
-            ),
+            "rust_compile_at_1_mean": r6(rust_compile["mean"]),
+            "rust_compile_at_1_std": r6(rust_compile.get("std", 0.0)),
+            "rust_test_at_1_mean": r6(rust_test["mean"]),
+            "rust_test_at_1_std": r6(rust_test.get("std", 0.0)),
+            "rust_transform_rate_mean": r6(rust_transform["mean"]),
+            "rust_transform_rate_std": r6(rust_transform.get("std", 0.0)),
+            "iron_compile_at_1_mean": r6(iron_compile["mean"]),
+            "iron_compile_at_1_std": r6(iron_compile.get("std", 0.0)),
+            "iron_test_at_1_mean": r6(iron_test["mean"]),
+            "iron_test_at_1_std": r6(iron_test.get("std", 0.0)),
+            "iron_transform_rate_mean": r6(iron_transform["mean"]),
+            "iron_transform_rate_std": r6(iron_transform.get("std", 0.0)),
+            "delta_iron_minus_rust_compile": r6(delta["compile_at_1_mean"]),
+            "delta_iron_minus_rust_test": r6(delta["test_at_1_mean"]),
         }
-        return row
 
     rust = data["rust"]
     iron = data["iron"]
@@ -173,89 +305,77 @@ def summarize_run(spec: RunSpec, data: dict[str, Any]) -> dict[str, Any]:
 
 def collect_per_family_rows(
     spec: RunSpec, data: dict[str, Any]
-) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-
-    if spec.kind == "aggregate":
-        for arm in ("rust", "iron"):
-            families = data["per_family"].get(arm, {})
-            for family, metrics in sorted(families.items()):
-                rows.append(
-                    {
-                        "run_key": spec.key,
-                        "run_label": spec.label,
-                        "report_path": spec.report_path.as_posix(),
-                        "arm": arm,
-                        "family": family,
-                        "compile_mean": r6(metrics["compile"]["mean"]),
-                        "compile_std": r6(metrics["compile"].get("std", 0.0)),
-                        "test_mean": r6(metrics["test"]["mean"]),
-                        "test_std": r6(metrics["test"].get("std", 0.0)),
-                    }
-                )
-        return rows
+) -> dict[str, list[Any]]:
+    columns: dict[str, list[Any]] = {
+        "run_key": [],
+        "run_label": [],
+        "report_path": [],
+        "arm": [],
+        "family": [],
+        "compile_mean": [],
+        "compile_std": [],
+        "test_mean": [],
+        "test_std": [],
+    }
 
     for arm in ("rust", "iron"):
-        families = data[arm].get("per_family", {})
-        for family, stats in sorted(families.items()):
-            n = stats.get("total", 0)
-            compile_mean = (stats.get("compile", 0) / n) if n else 0.0
-            test_mean = (stats.get("test", 0) / n) if n else 0.0
-            rows.append(
-                {
-                    "run_key": spec.key,
-                    "run_label": spec.label,
-                    "report_path": spec.report_path.as_posix(),
-                    "arm": arm,
-                    "family": family,
-                    "compile_mean": r6(compile_mean),
-                    "compile_std": 0.0,
-                    "test_mean": r6(test_mean),
-                    "test_std": 0.0,
-                }
-            )
-
-    return rows
-
-
-def collect_taxonomy_rows(spec: RunSpec, data: dict[str, Any]) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-
-    if spec.kind == "aggregate":
-        taxonomy = data.get("error_taxonomy", {})
-        for arm in ("rust", "iron"):
-            for failure_class, count in sorted(
-                taxonomy.get(arm, {}).items(), key=lambda item: (-item[1], item[0])
-            ):
-                rows.append(
-                    {
-                        "run_key": spec.key,
-                        "run_label": spec.label,
-                        "report_path": spec.report_path.as_posix(),
-                        "arm": arm,
-                        "failure_class": failure_class,
-                        "count": int(count),
-                    }
-                )
-        return rows
+        if spec.kind == "aggregate":
+            by_family = data["per_family"].get(arm, {})
+            families = sorted(by_family)
+            metrics = [by_family[family] for family in families]
+            compile_mean = [r6(m["compile"]["mean"]) for m in metrics]
+            compile_std = [r6(m["compile"].get("std", 0.0)) for m in metrics]
+            test_mean = [r6(m["test"]["mean"]) for m in metrics]
+            test_std = [r6(m["test"].get("std", 0.0)) for m in metrics]
+        else:
+            by_family = data[arm].get("per_family", {})
+            families = sorted(by_family)
+            stats = [by_family[family] for family in families]
+            compile_mean = [
+                r6(s.get("compile", 0) / s["total"] if s.get("total", 0) else 0.0)
+                for s in stats
+            ]
+            test_mean = [
+                r6(s.get("test", 0) / s["total"] if s.get("total", 0) else 0.0)
+                for s in stats
+            ]
+            compile_std = test_std = [0.0] * len(families)
+
+        extend_run_columns(columns, spec, arm, len(families))
+        columns["family"].extend(families)
+        columns["compile_mean"].extend(compile_mean)
+        columns["compile_std"].extend(compile_std)
+        columns["test_mean"].extend(test_mean)
+        columns["test_std"].extend(test_std)
+
+    return columns
+
+
+def collect_taxonomy_rows(spec: RunSpec, data: dict[str, Any]) -> dict[str, list[Any]]:
+    columns: dict[str, list[Any]] = {
+        "run_key": [],
+        "run_label": [],
+        "report_path": [],
+        "arm": [],
+        "failure_class": [],
+        "count": [],
+    }
 
     for arm in ("rust", "iron"):
-        taxonomy = data[arm].get("failure_taxonomy", {})
-        for failure_class, count in sorted(
-            taxonomy.items(), key=lambda item: (-item[1], item[0])
-        ):
-            rows.append(
-                {
-                    "run_key": spec.key,
-                    "run_label": spec.label,
-                    "report_path": spec.report_path.as_posix(),
-                    "arm": arm,
-                    "failure_class": failure_class,
-                    "count": int(count),
-                }
-            )
+        if spec.kind == "aggregate":
+            taxonomy = data.get("error_taxonomy", {}).get(arm, {})
+        else:
+            taxonomy = data[arm].get("failure_taxonomy", {})
+        # Highest count first, ties by class name: sort by name, then by count
+        # descending; the second sort is stable, so name order survives ties.
+        entries = sorted(taxonomy.items())
+        entries.sort(key=itemgetter(1), reverse=True)
 
-    return rows
+        extend_run_columns(columns, spec, arm, len(entries))
+        columns["failure_class"].extend(failure_class for failure_class, _ in entries)
+        columns["count"].extend(int(count) for _, count in entries)
+
+    return columns
 
 
 def collect_v26_seed_metrics(repo_root: Path) -> list[dict[str, Any]]:
@@ -288,8 +408,21 @@ def collect_v26_seed_metrics(repo_root: Path) -> list[dict[str, Any]]:
     return rows
 
 
-def collect_v26_failure_rows(repo_root: Path) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
+def collect_v26_failure_rows(repo_root: Path) -> dict[str, list[Any]]:
+    columns: dict[str, list[Any]] = {
+        "seed": [],
+        "arm": [],
+        "report_path": [],
+        "id": [],
+        "family": [],
+        "failure_phase": [],
+        "transform_ok": [],
+        "compile_ok": [],
+        "test_ok": [],
+        "transform_error": [],
+        "compile_error": [],
+        "test_error": [],
+    }
 
     for seed in (3407, 2108):
         report_path = repo_root / f"eval/v2_6/report_seed{seed}.json"
@@ -298,38 +431,35 @@ def collect_v26_failure_rows(repo_root: Path) -> list[dict[str, Any]]:
         data = load_json(report_path)
 
         for arm in ("rust", "iron"):
-            for row in data[arm].get("rows", []):
+            failures: list[tuple[dict[str, Any], bool, bool, bool]] = []
+            for row in load_report_rows(report_path, data, arm):
                 transform_ok = bool(row.get("transform_ok", False))
                 compile_ok = bool(row.get("compile_ok", False))
                 test_ok = bool(row.get("test_ok", False))
-                if transform_ok and compile_ok and test_ok:
-                    continue
-
-                if not transform_ok:
-                    failure_phase = "transform"
-                elif not compile_ok:
-                    failure_phase = "compile"
-                else:
-                    failure_phase = "test"
-
-                rows.append(
-                    {
-                        "seed": seed,
-                        "arm": arm,
-                        "report_path": report_path.as_posix(),
-                        "id": row.get("id", ""),
-                        "family": row.get("family", ""),
-                        "failure_phase": failure_phase,
-                        "transform_ok": transform_ok,
-                        "compile_ok": compile_ok,
-                        "test_ok": test_ok,
-                        "transform_error": row.get("transform_error", ""),
-                        "compile_error": row.get("compile_error", ""),
-                        "test_error": row.get("test_error", ""),
-                    }
+                if not (transform_ok and compile_ok and test_ok):
+                    failures.append((row, transform_ok, compile_ok, test_ok))
+
+            count = len(failures)
+            columns["seed"].extend([seed] * count)
+            columns["arm"].extend([arm] * count)
+            columns["report_path"].extend([report_path.as_posix()] * count)
+            columns["id"].extend(row.get("id", "") for row, *_ in failures)
+            columns["family"].extend(row.get("family", "") for row, *_ in failures)
+            columns["failure_phase"].extend(
+                (
+                    "transform"
+                    if not transform_ok
+                    else "compile" if not compile_ok else "test"
                 )
+                for _, transform_ok, compile_ok, _ in failures
+            )
+            columns["transform_ok"].extend(failure[1] for failure in failures)
+            columns["compile_ok"].extend(failure[2] for failure in failures)
+            columns["test_ok"].extend(failure[3] for failure in failures)
+            for name in ("transform_error", "compile_error", "test_error"):
+                columns[name].extend(row.get(name, "") for row, *_ in failures)
 
-    return rows
+    return columns
 
 
 def collect_dataset_rows(
@@ -366,14 +496,17 @@ def collect_dataset_rows(
             continue
 
         rows = load_jsonl(manifest_path)
-        split_counter: Counter[str] = Counter(row.get("split", "") for row in rows)
-        families = sorted({row.get("family", "") for row in rows if row.get("family")})
-
-        family_split_counts: defaultdict[str, Counter[str]] = defaultdict(Counter)
-        for row in rows:
-            family = row.get("family", "")
-            split = row.get("split", "")
-            family_split_counts[family][split] += 1
+        # One C-level tally of (family, split) pairs; the split totals, the
+        # family list and the per-family matrix are all derived from it.
+        pair_counts = Counter(
+            (row.get("family", ""), row.get("split", "")) for row in rows
+        )
+        split_counter: Counter[str] = Counter()
+        family_split_counts: dict[str, Counter[str]] = {}
+        for (family, split), count in pair_counts.items():
+            split_counter[split] += count
+            family_split_counts.setdefault(family, Counter())[split] = count
+        families = sorted(family for family in family_split_counts if family)
 
         gate_all_pass = ""
         if report_path is not None and report_path.exists():
@@ -457,145 +590,176 @@ def main() -> int:
     if not available_specs:
         raise FileNotFoundError("No configured reports were found")
 
-    aggregate_rows: list[dict[str, Any]] = []
-    per_family_rows: list[dict[str, Any]] = []
-    taxonomy_rows: list[dict[str, Any]] = []
-
-    for spec in available_specs:
-        data = load_json(spec.report_path)
-        aggregate_rows.append(summarize_run(spec, data))
-        per_family_rows.extend(collect_per_family_rows(spec, data))
-        taxonomy_rows.extend(collect_taxonomy_rows(spec, data))
-
-    v26_seed_rows = collect_v26_seed_metrics(repo_root)
-    v26_failure_rows = collect_v26_failure_rows(repo_root)
-    dataset_overview_rows, dataset_family_rows = collect_dataset_rows(repo_root)
-
-    write_csv(
-        out_dir / "aggregate_metrics_by_run.csv",
-        [
-            "run_key",
-            "run_label",
-            "report_path",
-            "num_reports",
-            "rust_compile_at_1_mean",
-            "rust_compile_at_1_std",
-            "rust_test_at_1_mean",
-            "rust_test_at_1_std",
-            "rust_transform_rate_mean",
-            "rust_transform_rate_std",
-            "iron_compile_at_1_mean",
-            "iron_compile_at_1_std",
-            "iron_test_at_1_mean",
-            "iron_test_at_1_std",
-            "iron_transform_rate_mean",
-            "iron_transform_rate_std",
-            "delta_iron_minus_rust_compile",
-            "delta_iron_minus_rust_test",
-        ],
-        aggregate_rows,
-    )
-
-    write_csv(
-        out_dir / "per_family_metrics_by_run.csv",
-        [
-            "run_key",
-            "run_label",
-            "report_path",
-            "arm",
-            "family",
-            "compile_mean",
-            "compile_std",
-            "test_mean",
-            "test_std",
-        ],
-        per_family_rows,
-    )
-
-    write_csv(
-        out_dir / "failure_taxonomy_by_run.csv",
-        [
-            "run_key",
-            "run_label",
-            "report_path",
-            "arm",
-            "failure_class",
-            "count",
-        ],
-        taxonomy_rows,
-    )
-
-    write_csv(
-        out_dir / "v2_6_seed_metrics.csv",
-        [
-            "seed",
-            "arm",
-            "report_path",
-            "total",
-            "transform_pass",
-            "transform_rate",
-            "compile_pass",
-            "compile_at_1",
-            "test_pass",
-            "test_at_1",
-        ],
-        v26_seed_rows,
-    )
-
-    write_csv(
-        out_dir / "v2_6_failure_rows.csv",
-        [
-            "seed",
-            "arm",
-            "report_path",
-            "id",
-            "family",
-            "failure_phase",
-            "transform_ok",
-            "compile_ok",
-            "test_ok",
-            "transform_error",
-            "compile_error",
-            "test_error",
-        ],
-        v26_failure_rows,
-    )
+    # Every table is streamed to its sink as soon as its rows are collected,
+    # so no table is held in full until the end of the run.
+    with contextlib.ExitStack() as stack:
+        aggregate_sink = stack.enter_context(
+            CSVSink(
+                out_dir / "aggregate_metrics_by_run.csv",
+                [
+                    "run_key",
+                    "run_label",
+                    "report_path",
+                    "num_reports",
+                    "rust_compile_at_1_mean",
+                    "rust_compile_at_1_std",
+                    "rust_test_at_1_mean",
+                    "rust_test_at_1_std",
+                    "rust_transform_rate_mean",
+                    "rust_transform_rate_std",
+                    "iron_compile_at_1_mean",
+                    "iron_compile_at_1_std",
+                    "iron_test_at_1_mean",
+                    "iron_test_at_1_std",
+                    "iron_transform_rate_mean",
+                    "iron_transform_rate_std",
+                    "delta_iron_minus_rust_compile",
+                    "delta_iron_minus_rust_test",
+                ],
+            )
+        )
+        per_family_sink = stack.enter_context(
+            CSVSink(
+                out_dir / "per_family_metrics_by_run.csv",
+                [
+                    "run_key",
+                    "run_label",
+                    "report_path",
+                    "arm",
+                    "family",
+                    "compile_mean",
+                    "compile_std",
+                    "test_mean",
+                    "test_std",
+                ],
+            )
+        )
+        taxonomy_sink = stack.enter_context(
+            CSVSink(
+                out_dir / "failure_taxonomy_by_run.csv",
+                [
+                    "run_key",
+                    "run_label",
+                    "report_path",
+                    "arm",
+                    "failure_class",
+                    "count",
+                ],
+            )
+        )
+        v26_seed_sink = stack.enter_context(
+            CSVSink(
+                out_dir / "v2_6_seed_metrics.csv",
+                [
+                    "seed",
+                    "arm",
+                    "report_path",
+                    "total",
+                    "transform_pass",
+                    "transform_rate",
+                    "compile_pass",
+                    "compile_at_1",
+                    "test_pass",
+                    "test_at_1",
+                ],
+            )
+        )
+        v26_failure_sink = stack.enter_context(
+            CSVSink(
+                out_dir / "v2_6_failure_rows.csv",
+                [
+                    "seed",
+                    "arm",
+                    "report_path",
+                    "id",
+                    "family",
+                    "failure_phase",
+                    "transform_ok",
+                    "compile_ok",
+                    "test_ok",
+                    "transform_error",
+                    "compile_error",
+                    "test_error",
+                ],
+            )
+        )
+        dataset_overview_sink = stack.enter_context(
+            CSVSink(
+                out_dir / "dataset_overview.csv",
+                [
+                    "dataset_version",
+                    "manifest_path",
+                    "total_tasks",
+                    "family_count",
+                    "train_count",
+                    "val_count",
+                    "test_count",
+                    "gate_all_pass",
+                    "added_tasks",
+                    "families_added",
+                    "export_rust_train",
+                    "export_rust_val",
+                    "export_rust_test",
+                    "export_iron_train",
+                    "export_iron_val",
+                    "export_iron_test",
+                ],
+            )
+        )
+        dataset_family_sink = stack.enter_context(
+            CSVSink(
+                out_dir / "dataset_family_counts.csv",
+                [
+                    "dataset_version",
+                    "family",
+                    "total_count",
+                    "train_count",
+                    "val_count",
+                    "test_count",
+                ],
+            )
+        )
 
-    write_csv(
-        out_dir / "dataset_overview.csv",
-        [
-            "dataset_version",
-            "manifest_path",
-            "total_tasks",
-            "family_count",
-            "train_count",
-            "val_count",
-            "test_count",
-            "gate_all_pass",
-            "added_tasks",
-            "families_added",
-            "export_rust_train",
-            "export_rust_val",
-            "export_rust_test",
-            "export_iron_train",
-            "export_iron_val",
-            "export_iron_test",
-        ],
-        dataset_overview_rows,
-    )
+        # Every input file is read independently, so the reads overlap on a
+        # thread pool; map() keeps the reports in spec order.
+        executor = stack.enter_context(ThreadPoolExecutor())
+        # The two v2.6 collectors share one task so the second is served
+        # from load_json's cache instead of racing the first to parse.
+        v26_future = executor.submit(
+            lambda: (
+                collect_v26_seed_metrics(repo_root),
+                collect_v26_failure_rows(repo_root),
+            )
+        )
+        dataset_future = executor.submit(collect_dataset_rows, repo_root)
+        reports = executor.map(
+            load_json, [spec.report_path for spec in available_specs]
+        )
 
-    write_csv(
-        out_dir / "dataset_family_counts.csv",
-        [
-            "dataset_version",
-            "family",
-            "total_count",
-            "train_count",
-            "val_count",
-            "test_count",
-        ],
-        dataset_family_rows,
-    )
+        for spec, data in zip(available_specs, reports):
+            aggregate_sink.write_row(summarize_run(spec, data))
+            per_family_sink.write_columns(collect_per_family_rows(spec, data))
+            taxonomy_sink.write_columns(collect_taxonomy_rows(spec, data))
+
+        v26_seed_rows, v26_failure_columns = v26_future.result()
+        v26_seed_sink.write_rows(v26_seed_rows)
+        v26_failure_sink.write_columns(v26_failure_columns)
+
+        dataset_overview_rows, dataset_family_rows = dataset_future.result()
+        dataset_overview_sink.write_rows(dataset_overview_rows)
+        dataset_family_sink.write_rows(dataset_family_rows)
+
+    # Every table was built, so all of them replace the previous outputs.
+    for sink in (
+        aggregate_sink,
+        per_family_sink,
+        taxonomy_sink,
+        v26_seed_sink,
+        v26_failure_sink,
+        dataset_overview_sink,
+        dataset_family_sink,
+    ):
+        sink.publish()
 
     print(f"Wrote CSV files to {out_dir}")
     print("- aggregate_metrics_by_run.csv")
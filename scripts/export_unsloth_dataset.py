@@ -4,15 +4,44 @@
 from __future__ import annotations
 
 import argparse
+import atexit
 import json
+import os
 import re
 import shlex
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
+_JSONL_BATCH_LINES = 4096
+_SCRATCH = threading.local()
+_CONTRACT_MARKER = "Required interface contract (must match exactly):"
+_CONTRACT_TEMPLATE = (
+    f"{_CONTRACT_MARKER}\n"
+    "`{signature}`\n"
+    "Do not change the function name, parameters, or return type. "
+    "You may add helper functions only if needed."
+)
+_LANGUAGE_INSTRUCTIONS = {
+    language: f"Write only valid {language} code for this task. Do not include explanations."
+    for language in ("Rust", "Iron")
+}
+# json.dumps builds a new encoder whenever non-default options are passed,
+# so the compact row encoder is constructed once and reused.
+_ROW_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+# A `pub fn` signature up to its opening brace. The task's own function is
+# picked by name after matching, so one compiled pattern serves every task.
+_RUST_PUB_FN_RE = re.compile(
+    r"(?m)^\s*(pub\s+fn\s+(?P<name>[A-Za-z_][A-Za-z0-9_]*)\s*\([^\n]*\)\s*(?:->\s*[^\{\n]+)?)\s*\{"
+)
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -35,6 +64,12 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Abort if any task fails Rust->Iron reduction",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of redox reduce calls to run concurrently (default: CPU count)",
+    )
     return parser.parse_args()
 
 
@@ -49,6 +84,9 @@ def main() -> int:
     if not redox_cmd:
         print("ERROR: --redox-cmd cannot be empty", file=sys.stderr)
         return 2
+    if args.jobs < 1:
+        print("ERROR: --jobs must be at least 1", file=sys.stderr)
+        return 2
 
     records = load_manifest(manifest)
     base_dir = manifest.parent
@@ -60,16 +98,28 @@ def main() -> int:
     iron_rows: dict[str, list[dict]] = defaultdict(list)
     reduce_failures: list[str] = []
 
+    tasks: list[tuple[dict, str, str]] = []
     for record in records:
-        task_id = record["id"]
-        split = record["split"]
-        family = record["family"]
-
         prompt_path = (base_dir / record["prompt_path"]).resolve()
         rust_path = (base_dir / record["rust_path"]).resolve()
-
         prompt_text = prompt_path.read_text(encoding="utf-8").strip()
         rust_code = rust_path.read_text(encoding="utf-8").strip()
+        tasks.append((record, prompt_text, rust_code))
+
+    # Each reduce is an independent redox subprocess, so threads overlap them;
+    # map() keeps results in manifest order for deterministic output.
+    accepts_stdin = supports_stdin(redox_cmd)
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        iron_codes = list(
+            executor.map(
+                lambda task: reduce_to_iron(redox_cmd, task[2], accepts_stdin), tasks
+            )
+        )
+
+    for (record, prompt_text, rust_code), iron_code in zip(tasks, iron_codes):
+        task_id = record["id"]
+        split = record["split"]
+        family = record["family"]
 
         rust_rows[split].append(
             build_row(
@@ -87,7 +137,6 @@ def main() -> int:
             )
         )
 
-        iron_code = reduce_to_iron(redox_cmd, rust_code)
         if iron_code is None:
             msg = f"{task_id}: reduce failed"
             reduce_failures.append(msg)
@@ -95,6 +144,7 @@ def main() -> int:
                 print(f"ERROR: {msg}", file=sys.stderr)
                 return 1
             continue
+        iron_code = iron_code.strip()
 
         iron_rows[split].append(
             build_row(
@@ -105,11 +155,9 @@ def main() -> int:
                 user_prompt=build_user_prompt(
                     task_prompt=prompt_text,
                     language="Iron",
-                    required_signature=extract_iron_signature(
-                        iron_code.strip(), task_id
-                    ),
+                    required_signature=extract_iron_signature(iron_code, task_id),
                 ),
-                assistant_code=iron_code.strip(),
+                assistant_code=iron_code,
                 language="iron",
             )
         )
@@ -142,11 +190,29 @@ def main() -> int:
 
 
 def load_manifest(path: Path) -> list[dict]:
+    # Stream the file and parse it in fixed-size batches, so raw text held
+    # at once is bounded by the batch rather than the whole file.
     records: list[dict] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        records.append(json.loads(line))
+    with path.open("rb") as f:
+        lines = (line for line in f if line.strip())
+        while batch := list(islice(lines, _JSONL_BATCH_LINES)):
+            records.extend(parse_json_lines(batch))
+    return records
+
+
+def parse_json_lines(lines: list[bytes]) -> list[dict]:
+    """Parse non-blank JSONL lines with one decoder call over a wrapped array.
+
+    Falls back to parsing each line on its own when the wrapped document is
+    invalid or the record count does not match, so bad input raises the same
+    error as before.
+    """
+    try:
+        records = json.loads(b"[" + b",".join(lines) + b"]")
+    except json.JSONDecodeError:
+        records = None
+    if records is None or len(records) != len(lines):
+        records = [json.loads(line) for line in lines]
     return records
 
 
@@ -158,55 +224,49 @@ def build_user_prompt(
     prompt_parts = [strip_existing_contract(task_prompt)]
 
     if required_signature:
-        prompt_parts.append(
-            "Required interface contract (must match exactly):\n"
-            f"`{required_signature}`\n"
-            "Do not change the function name, parameters, or return type. "
-            "You may add helper functions only if needed."
-        )
+        prompt_parts.append(_CONTRACT_TEMPLATE.format(signature=required_signature))
 
-    prompt_parts.append(
-        f"Write only valid {language} code for this task. Do not include explanations."
-    )
+    prompt_parts.append(_LANGUAGE_INSTRUCTIONS[language])
 
     return "\n\n".join(prompt_parts)
 
 
 def strip_existing_contract(task_prompt: str) -> str:
     lines = task_prompt.strip().splitlines()
-    marker = "Required interface contract (must match exactly):"
+    if _CONTRACT_MARKER not in task_prompt:
+        return "\n".join(lines).strip()
+
+    # Strip each line once up front; the scan compares the stripped copies
+    # and keeps the original lines.
+    stripped = [line.strip() for line in lines]
+    count = len(lines)
     out: list[str] = []
     i = 0
 
-    while i < len(lines):
-        if lines[i].strip() != marker:
+    while i < count:
+        if stripped[i] != _CONTRACT_MARKER:
             out.append(lines[i])
             i += 1
             continue
 
         i += 1
-        while i < len(lines) and lines[i].strip():
+        while i < count and stripped[i]:
             i += 1
-        while i < len(lines) and not lines[i].strip():
+        while i < count and not stripped[i]:
             i += 1
 
     return "\n".join(out).strip()
 
 
 def extract_rust_signature(rust_code: str, task_id: str) -> str | None:
-    named_pattern = re.compile(
-        rf"(?m)^\s*(pub\s+fn\s+{re.escape(task_id)}\s*\([^\n]*\)\s*(?:->\s*[^\{{\n]+)?)\s*\{{"
-    )
-    m = named_pattern.search(rust_code)
-    if m:
-        return " ".join(m.group(1).split())
-
-    fallback_pattern = re.compile(
-        r"(?m)^\s*(pub\s+fn\s+[A-Za-z_][A-Za-z0-9_]*\s*\([^\n]*\)\s*(?:->\s*[^\{\n]+)?)\s*\{"
-    )
-    m = fallback_pattern.search(rust_code)
-    if m:
-        return " ".join(m.group(1).split())
+    first = None
+    for m in _RUST_PUB_FN_RE.finditer(rust_code):
+        if m.group("name") == task_id:
+            return " ".join(m.group(1).split())
+        if first is None:
+            first = m
+    if first is not None:
+        return " ".join(first.group(1).split())
     return None
 
 
@@ -260,20 +320,53 @@ def build_row(
     }
 
 
-def reduce_to_iron(redox_cmd: list[str], rust_source: str) -> str | None:
-    with tempfile.TemporaryDirectory(prefix="redox_export_") as tmp:
-        rust_path = Path(tmp) / "input.rs"
-        rust_path.write_text(rust_source, encoding="utf-8")
+def supports_stdin(redox_cmd: list[str]) -> bool:
+    """Return True if the redox binary reads `-` as stdin."""
+    try:
+        probe = subprocess.run(
+            [*redox_cmd, "reduce", "-"], input=b"", capture_output=True, check=False
+        )
+    except OSError:
+        return False
+    return probe.returncode == 0
+
 
+def scratch_dir() -> Path:
+    """Return this thread's scratch directory, created once and reused per call."""
+    path = getattr(_SCRATCH, "path", None)
+    if path is None:
+        path = Path(tempfile.mkdtemp(prefix="redox_export_"))
+        atexit.register(shutil.rmtree, path, ignore_errors=True)
+        _SCRATCH.path = path
+    return path
+
+
+def reduce_to_iron(
+    redox_cmd: list[str], rust_source: str, accepts_stdin: bool = False
+) -> str | None:
+    if accepts_stdin:
+        proc = subprocess.run(
+            [*redox_cmd, "reduce", "-"],
+            input=rust_source,
+            # Pin UTF-8 both ways; text=True alone would use the locale
+            # encoding, which breaks non-ASCII source under C/POSIX.
+            encoding="utf-8",
+            capture_output=True,
+            check=False,
+        )
+    else:
+        # Older binaries only take a path argument.
+        rust_path = scratch_dir() / "input.rs"
+        rust_path.write_text(rust_source, encoding="utf-8")
         proc = subprocess.run(
             [*redox_cmd, "reduce", str(rust_path)],
-            text=True,
+            encoding="utf-8",
             capture_output=True,
             check=False,
         )
-        if proc.returncode != 0:
-            return None
-        return proc.stdout
+    if proc.returncode != 0:
+        return None
+    return proc.stdout
 
 
 def write_split_files(
@@ -282,9 +375,9 @@ def write_split_files(
     for split in ("train", "val", "test"):
         rows = rows_by_split.get(split, [])
         out_file = out_dir / f"{prefix}_{split}.jsonl"
-        with out_file.open("w", encoding="utf-8") as f:
-            for row in rows:
-                f.write(json.dumps(row, separators=(",", ":")) + "\n")
+        encode = _ROW_ENCODER.encode
+        with out_file.open("w", encoding="utf-8", buffering=1 << 20) as f:
+            f.writelines(encode(row) + "\n" for row in rows)
 
 
 if __name__ == "__main__":
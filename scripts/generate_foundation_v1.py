@@ -4,9 +4,33 @@
 from __future__ import annotations
 
 import json
-import re
+import os
 from pathlib import Path
 
+# json.dumps builds a new encoder whenever non-default options are passed,
+# so the compact manifest encoder is constructed once and reused.
+_ROW_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def rust_signature(task_id: str, params: str, ret: str) -> str:
+    """Return the `pub fn` header a task's Rust source is built from."""
+    return f"pub fn {task_id}({params}) -> {ret}"
+
+
+def write_text_file(path: Path, text: str) -> None:
+    """Write one small generated file with raw os calls.
+
+    Skips the buffered text-file stack that `Path.write_text` sets up, which
+    costs more than the write itself for a few hundred bytes.
+    """
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
 
 def main() -> None:
     base = Path("data/pilot/foundation_v1")
@@ -19,27 +43,7 @@ def main() -> None:
 
     records: list[dict[str, object]] = []
 
-    def rust_signature_for_task(rust_code: str, task_id: str) -> str | None:
-        pattern = re.compile(
-            rf"(?m)^\s*(pub\s+fn\s+{re.escape(task_id)}\s*\([^\n]*\)\s*(?:->\s*[^\{{\n]+)?)\s*\{{"
-        )
-        m = pattern.search(rust_code)
-        if m:
-            return " ".join(m.group(1).split())
-
-        fallback = re.compile(
-            r"(?m)^\s*(pub\s+fn\s+[A-Za-z_][A-Za-z0-9_]*\s*\([^\n]*\)\s*(?:->\s*[^\{\n]+)?)\s*\{"
-        )
-        m = fallback.search(rust_code)
-        if m:
-            return " ".join(m.group(1).split())
-        return None
-
-    def prompt_with_contract(prompt_text: str, rust_code: str, task_id: str) -> str:
-        signature = rust_signature_for_task(rust_code, task_id)
-        if signature is None:
-            return prompt_text.strip()
-
+    def prompt_with_contract(prompt_text: str, signature: str) -> str:
         return (
             f"{prompt_text.strip()}\n\n"
             "Required interface contract (must match exactly):\n"
@@ -53,12 +57,13 @@ def main() -> None:
         family: str,
         prompt_text: str,
         rust_code: str,
+        signature: str,
     ) -> None:
-        (prompts / f"{task_id}.md").write_text(
-            prompt_with_contract(prompt_text, rust_code, task_id) + "\n",
-            encoding="utf-8",
+        write_text_file(
+            prompts / f"{task_id}.md",
+            prompt_with_contract(prompt_text, signature) + "\n",
         )
-        (rust / f"{task_id}.rs").write_text(rust_code.strip() + "\n", encoding="utf-8")
+        write_text_file(rust / f"{task_id}.rs", rust_code.strip() + "\n")
         records.append(
             {
                 "id": task_id,
@@ -73,70 +78,83 @@ def main() -> None:
 
     for i in range(1, 31):
         task = f"add_const_{i:03d}"
+        signature = rust_signature(task, "x: i32", "i32")
         add_task(
             task,
             "train",
             "arith_add_const",
             f"# Add Constant\n\nImplement a function that adds {i} to an input `i32`.",
-            f"pub fn {task}(x: i32) -> i32 {{\n    x + {i}\n}}",
+            f"{signature} {{\n    x + {i}\n}}",
+            signature,
         )
 
     for i in range(1, 31):
         k = i + 1
         task = f"mul_const_{i:03d}"
+        signature = rust_signature(task, "x: i32", "i32")
         add_task(
             task,
             "train",
             "arith_mul_const",
             f"# Multiply Constant\n\nImplement a function that multiplies an input `i32` by {k}.",
-            f"pub fn {task}(x: i32) -> i32 {{\n    x * {k}\n}}",
+            f"{signature} {{\n    x * {k}\n}}",
+            signature,
         )
 
     for i in range(1, 21):
         task = f"option_some_{i:03d}"
         v = 10 + i
+        signature = rust_signature(task, "", "Option<i32>")
         add_task(
             task,
             "train",
             "option_some_const",
             f"# Return Some Constant\n\nImplement a function that returns `Some({v})`.",
-            f"pub fn {task}() -> Option<i32> {{\n    Some({v})\n}}",
+            f"{signature} {{\n    Some({v})\n}}",
+            signature,
         )
 
     for i in range(1, 21):
         task = f"option_map_add_{i:03d}"
+        signature = rust_signature(task, "input: Option<i32>", "Option<i32>")
         add_task(
             task,
             "train",
             "option_map_add_const",
             f"# Map Option Add\n\nImplement a function that adds {i} to an `Option<i32>` using `map`.",
-            f"pub fn {task}(input: Option<i32>) -> Option<i32> {{\n    input.map(|n| n + {i})\n}}",
+            f"{signature} {{\n    input.map(|n| n + {i})\n}}",
+            signature,
         )
 
     for i in range(1, 21):
         task = f"vec_push_{i:03d}"
         v = i * 3
+        signature = rust_signature(task, "", "Vec<i32>")
         add_task(
             task,
             "train",
             "vec_push_const",
             f"# Push Value To Vec\n\nImplement a function that pushes {v} into a new vector and returns it.",
-            f"pub fn {task}() -> Vec<i32> {{\n    let mut v = Vec::new();\n    v.push({v});\n    v\n}}",
+            f"{signature} {{\n    let mut v = Vec::new();\n    v.push({v});\n    v\n}}",
+            signature,
         )
 
     for i in range(1, 21):
         task = f"vec_capacity_{i:03d}"
         cap = i + 5
+        signature = rust_signature(task, "", "Vec<i32>")
         add_task(
             task,
             "train",
             "vec_with_capacity",
             f"# Vec With Capacity\n\nImplement a function that returns a vector with capacity {cap}.",
-            f"pub fn {task}() -> Vec<i32> {{\n    Vec::with_capacity({cap})\n}}",
+            f"{signature} {{\n    Vec::with_capacity({cap})\n}}",
+            signature,
         )
 
     for i in range(1, 21):
         task = f"helper_inc_{i:03d}"
+        signature = rust_signature(task, "x: i32", "i32")
         add_task(
             task,
             "train",
@@ -144,24 +162,28 @@ def main() -> None:
             f"# Helper Call\n\nImplement a helper function and call it to add {i}.",
             (
                 f"fn inc_{i:03d}(x: i32) -> i32 {{\n    x + {i}\n}}\n\n"
-                f"pub fn {task}(x: i32) -> i32 {{\n    inc_{i:03d}(x)\n}}"
+                f"{signature} {{\n    inc_{i:03d}(x)\n}}"
             ),
+            signature,
         )
 
     for i in range(1, 21):
         task = f"result_ok_{i:03d}"
         v = 100 + i
+        signature = rust_signature(task, "", "Result<i32, ()>")
         add_task(
             task,
             "val",
             "result_ok_const",
             f"# Return Ok Constant\n\nImplement a function that returns `Ok({v})` with unit error type.",
-            f"pub fn {task}() -> Result<i32, ()> {{\n    Ok({v})\n}}",
+            f"{signature} {{\n    Ok({v})\n}}",
+            signature,
         )
 
     for i in range(1, 11):
         task = f"alias_result_{i:03d}"
         v = 200 + i
+        signature = rust_signature(task, "", f"Alias{i:03d}<i32>")
         add_task(
             task,
             "val",
@@ -169,29 +191,34 @@ def main() -> None:
             f"# Result Type Alias\n\nDefine a generic result alias and return `Ok({v})`.",
             (
                 f"type Alias{i:03d}<T> = Result<T, ()>;\n\n"
-                f"pub fn {task}() -> Alias{i:03d}<i32> {{\n    Ok({v})\n}}"
+                f"{signature} {{\n    Ok({v})\n}}"
             ),
+            signature,
         )
 
     for i in range(1, 11):
         task = f"closure_shift_{i:03d}"
         k = i + 2
+        signature = rust_signature(task, "x: i32", "i32")
         add_task(
             task,
             "test",
             "closure_shift_const",
             f"# Closure Shift\n\nImplement a function using a closure that adds {k} to input.",
-            f"pub fn {task}(x: i32) -> i32 {{\n    let f = |n| n + {k};\n    f(x)\n}}",
+            f"{signature} {{\n    let f = |n| n + {k};\n    f(x)\n}}",
+            signature,
         )
 
     for i in range(1, 11):
         task = f"result_unwrap_or_{i:03d}"
+        signature = rust_signature(task, "input: Result<i32, String>", "i32")
         add_task(
             task,
             "test",
             "result_unwrap_or_const",
             f"# Result Unwrap Or\n\nImplement a function that unwraps `Result<i32, String>` or returns {i}.",
-            f"pub fn {task}(input: Result<i32, String>) -> i32 {{\n    input.unwrap_or({i})\n}}",
+            f"{signature} {{\n    input.unwrap_or({i})\n}}",
+            signature,
         )
 
     for i in range(1, 11):
@@ -199,17 +226,21 @@ def main() -> None:
         a = i
         b = i + 1
         c = i + 2
+        signature = rust_signature(task, "", "Option<i32>")
         add_task(
             task,
             "test",
             "vec_pop_basic",
             f"# Pop From Vector\n\nImplement a function that pops from `vec![{a}, {b}, {c}]`.",
-            f"pub fn {task}() -> Option<i32> {{\n    let mut v = vec![{a}, {b}, {c}];\n    v.pop()\n}}",
+            f"{signature} {{\n    let mut v = vec![{a}, {b}, {c}];\n    v.pop()\n}}",
+            signature,
         )
 
-    with manifest.open("w", encoding="utf-8") as f:
-        for rec in records:
-            f.write(json.dumps(rec, separators=(",", ":")) + "\n")
+    # The whole manifest is a few tens of KB, so it goes out in one write.
+    write_text_file(
+        manifest,
+        "".join(_ROW_ENCODER.encode(rec) + "\n" for rec in records),
+    )
 
     print(f"Generated {len(records)} tasks at {manifest}")
 
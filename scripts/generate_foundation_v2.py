@@ -3,17 +3,133 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import shutil
 from pathlib import Path
 
+# json.dumps builds a new encoder whenever non-default options are passed,
+# so the compact manifest encoder is constructed once and reused.
+_ROW_ENCODER = json.JSONEncoder(separators=(",", ":"))
+_CONTRACT_MARKER = "Required interface contract (must match exactly):"
+_CONTRACT_MARKER_BYTES = _CONTRACT_MARKER.encode("ascii")
+
+# Any `pub fn` signature up to its opening brace, used when the task's own
+# function is not found by name.
+_FALLBACK_SIG_RE = re.compile(
+    r"(?m)^\s*(pub\s+fn\s+[A-Za-z_][A-Za-z0-9_]*\s*\([^\n]*\)\s*(?:->\s*[^\{\n]+)?)\s*\{"
+)
+
+
+def scan_signature(rust_code: str, task_id: str) -> str | None:
+    """Cut a one-line `pub fn <task_id>(...) -> ... {` header out by string scan.
+
+    Returns None whenever the header is not in that plain shape, so callers
+    fall back to the regex search for anything unusual.
+    """
+    start = rust_code.find(f"pub fn {task_id}(")
+    if start < 0:
+        return None
+    line_start = rust_code.rfind("\n", 0, start) + 1
+    if rust_code[line_start:start].strip():
+        return None
+    line_end = rust_code.find("\n", start)
+    if line_end < 0:
+        line_end = len(rust_code)
+    brace = rust_code.find("{", start, line_end)
+    # A `)` after the brace could end a longer header the regex would pick.
+    if brace < 0 or ")" in rust_code[brace:line_end]:
+        return None
+
+    head = rust_code[start:brace]
+    close = head.rfind(")")
+    rest = head[close + 1 :].strip()
+    if close < 0 or (rest and not (rest.startswith("->") and len(rest) > 2)):
+        return None
+    return " ".join(head.split())
+
+
+def rust_signature_for_task(rust_code: str, task_id: str) -> str | None:
+    signature = scan_signature(rust_code, task_id)
+    if signature is not None:
+        return signature
+
+    pattern = re.compile(
+        rf"(?m)^\s*(pub\s+fn\s+{re.escape(task_id)}\s*\([^\n]*\)\s*(?:->\s*[^\{{\n]+)?)\s*\{{"
+    )
+    m = pattern.search(rust_code)
+    if m:
+        return " ".join(m.group(1).split())
+
+    m = _FALLBACK_SIG_RE.search(rust_code)
+    if m:
+        return " ".join(m.group(1).split())
+    return None
+
+
+def prompt_with_contract(prompt_text: str, rust_code: str, task_id: str) -> str:
+    cleaned = prompt_text.strip()
+    if _CONTRACT_MARKER in cleaned:
+        return cleaned
+
+    signature = rust_signature_for_task(rust_code, task_id)
+    if signature is None:
+        return cleaned
+
+    return (
+        f"{cleaned}\n\n"
+        f"{_CONTRACT_MARKER}\n"
+        f"`{signature}`\n"
+        "Do not change the function name, parameters, or return type."
+    )
+
+
+def write_text_file(path: Path, text: str) -> None:
+    """Write one small generated file with raw os calls.
+
+    Skips the buffered text-file stack that `Path.write_text` sets up, which
+    costs more than the write itself for a few hundred bytes.
+    """
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
+def decode_text(raw: bytes) -> str:
+    """Decode file bytes with the newline translation `Path.read_text` applies.
+
+    Reading bytes directly skips the buffered text wrapper read_text builds
+    for each small file.
+    """
+    return raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def is_final_prompt(raw: bytes) -> bool:
+    """Return True if the re-contract pass would leave these prompt bytes as-is.
+
+    That holds for a contracted prompt with LF newlines, one trailing newline
+    and printable ASCII at both ends, since strip() then removes nothing; the
+    check runs on the raw bytes so such prompts are never decoded.
+    """
+    return (
+        _CONTRACT_MARKER_BYTES in raw
+        and b"\r" not in raw
+        and raw.endswith(b"\n")
+        and len(raw) >= 2
+        and 0x21 <= raw[0] <= 0x7E
+        and 0x21 <= raw[-2] <= 0x7E
+    )
+
 
 def load_jsonl(path: Path) -> list[dict]:
-    rows = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if line.strip():
-            rows.append(json.loads(line))
-    return rows
+    # Iterate the file's lines directly; json.loads takes the raw bytes, so
+    # neither a decoded copy of the file nor a split list is built first.
+    with path.open("rb") as f:
+        return [json.loads(line) for line in f if line.strip()]
 
 
 def main() -> None:
@@ -30,6 +146,8 @@ def main() -> None:
     (v2 / "prompts").mkdir(parents=True, exist_ok=True)
     (v2 / "rust").mkdir(parents=True, exist_ok=True)
 
+    # v2 starts as independent copies of v1's files, so regenerating or
+    # editing v1 later never changes an already-built v2.
     for src in (v1 / "prompts").glob("*.md"):
         shutil.copy2(src, v2 / "prompts" / src.name)
     for src in (v1 / "rust").glob("*.rs"):
@@ -38,61 +156,34 @@ def main() -> None:
     rows = load_jsonl(v1 / "manifest.v1_candidate.jsonl")
     ids = {r["id"] for r in rows}
 
-    def rust_signature_for_task(rust_code: str, task_id: str) -> str | None:
-        pattern = re.compile(
-            rf"(?m)^\s*(pub\s+fn\s+{re.escape(task_id)}\s*\([^\n]*\)\s*(?:->\s*[^\{{\n]+)?)\s*\{{"
-        )
-        m = pattern.search(rust_code)
-        if m:
-            return " ".join(m.group(1).split())
-
-        fallback = re.compile(
-            r"(?m)^\s*(pub\s+fn\s+[A-Za-z_][A-Za-z0-9_]*\s*\([^\n]*\)\s*(?:->\s*[^\{\n]+)?)\s*\{"
-        )
-        m = fallback.search(rust_code)
-        if m:
-            return " ".join(m.group(1).split())
-        return None
-
-    def prompt_with_contract(prompt_text: str, rust_code: str, task_id: str) -> str:
-        marker = "Required interface contract (must match exactly):"
-        cleaned = prompt_text.strip()
-        if marker in cleaned:
-            return cleaned
-
-        signature = rust_signature_for_task(rust_code, task_id)
-        if signature is None:
-            return cleaned
-
-        return (
-            f"{cleaned}\n\n"
-            "Required interface contract (must match exactly):\n"
-            f"`{signature}`\n"
-            "Do not change the function name, parameters, or return type."
-        )
-
     for row in rows:
         task_id = row["id"]
         prompt_path = v2 / row["prompt_path"]
         rust_path = v2 / row["rust_path"]
-        prompt_text = prompt_path.read_text(encoding="utf-8")
-        rust_code = rust_path.read_text(encoding="utf-8")
-        prompt_path.write_text(
-            prompt_with_contract(prompt_text, rust_code, task_id) + "\n",
-            encoding="utf-8",
-        )
+        raw_prompt = prompt_path.read_bytes()
+        if is_final_prompt(raw_prompt):
+            continue
+        # The raw bytes are kept so a prompt already in its final form is
+        # not rewritten.
+        prompt_text = decode_text(raw_prompt)
+        if _CONTRACT_MARKER in prompt_text:
+            # Already contracted: only the trim applies, the Rust is not needed.
+            new_prompt = prompt_text.strip() + "\n"
+        else:
+            rust_code = decode_text(rust_path.read_bytes())
+            new_prompt = prompt_with_contract(prompt_text, rust_code, task_id) + "\n"
+        if new_prompt.encode("utf-8") != raw_prompt:
+            write_text_file(prompt_path, new_prompt)
 
     def add_task(task_id: str, family: str, prompt: str, rust: str) -> None:
         if task_id in ids:
             raise ValueError(f"Duplicate id: {task_id}")
         ids.add(task_id)
-        (v2 / "prompts" / f"{task_id}.md").write_text(
+        write_text_file(
+            v2 / "prompts" / f"{task_id}.md",
             prompt_with_contract(prompt, rust, task_id) + "\n",
-            encoding="utf-8",
-        )
-        (v2 / "rust" / f"{task_id}.rs").write_text(
-            rust.strip() + "\n", encoding="utf-8"
         )
+        write_text_file(v2 / "rust" / f"{task_id}.rs", rust.strip() + "\n")
         rows.append(
             {
                 "id": task_id,
@@ -158,9 +249,11 @@ def main() -> None:
         )
 
     manifest_path = v2 / "manifest.v2_candidate.jsonl"
-    with manifest_path.open("w", encoding="utf-8") as f:
-        for row in rows:
-            f.write(json.dumps(row, separators=(",", ":")) + "\n")
+    # The whole manifest is a few tens of KB, so it goes out in one write.
+    write_text_file(
+        manifest_path,
+        "".join(_ROW_ENCODER.encode(row) + "\n" for row in rows),
+    )
 
     summary = {
         "base_source": str(v1),
@@ -5,11 +5,94 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from string import Template
+
+import matplotlib
+
+# Figures are only ever written to files; selecting Agg before pyplot loads
+# keeps it from probing for and initialising a GUI toolkit.
+matplotlib.use("Agg")
 
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.figure import Figure
 
+_FIG4_IRON_CODE = """function closure_shift_001
+    takes x of i32
+    returns i32
+begin
+    define f as closure with parameters n and body n plus 3
+    call f with x
+end function"""
+
+# LaTeX is full of braces, so the listing uses $-placeholders rather than
+# an f-string or str.format with every brace doubled.
+_FIG4_TEMPLATE = Template(r"""% Figure 4: syntax comparison using lstlisting
+% Requires packages: listings, caption
+
+\begin{figure}[t]
+\centering
+\begin{minipage}[t]{0.48\linewidth}
+\captionof{lstlisting}{Rust snippet}
+\begin{lstlisting}[language=Rust,basicstyle=\ttfamily\small]
+$rust_code
+\end{lstlisting}
+\end{minipage}\hfill
+\begin{minipage}[t]{0.48\linewidth}
+\captionof{lstlisting}{Iron snippet}
+\begin{lstlisting}[basicstyle=\ttfamily\small]
+$iron_code
+\end{lstlisting}
+\end{minipage}
+\caption{Syntax comparison: Rust vs Iron for the same function contract.}
+\label{fig:syntax_comparison}
+\end{figure}
+""")
+
+_INCLUDE_SNIPPETS = """% Figure include snippets for LaTeX
+% Add in preamble: \\usepackage{graphicx}, \\usepackage{listings}, \\usepackage{caption}
+
+% Figure 1: Money Plot
+\\begin{figure}[t]
+  \\centering
+  \\includegraphics[width=0.82\\linewidth]{docs/figures/phase1/fig1_money_plot_v26.pdf}
+  \\caption{Final performance comparison (v2.6 aggregate): compile@1 and test@1.}
+  \\label{fig:money_plot}
+\\end{figure}
+
+% Figure 2: Progression
+\\begin{figure}[t]
+  \\centering
+  \\includegraphics[width=0.82\\linewidth]{docs/figures/phase1/fig2_progression_iron_test.pdf}
+  \\caption{Iron test@1 progression across iterations (v1 to v2.6).}
+  \\label{fig:progression}
+\\end{figure}
+
+% Figure 3: Error Shift
+\\begin{figure}[t]
+  \\centering
+  \\includegraphics[width=0.82\\linewidth]{docs/figures/phase1/fig3_error_shift_v25.pdf}
+  \\caption{Failure taxonomy contrast (v2.5 aggregate): Rust semantic failures vs Iron transform failures.}
+  \\label{fig:error_shift}
+\\end{figure}
+
+% Figure 4 uses a listing-based figure snippet:
+% \\input{docs/figures/phase1/fig4_syntax_comparison.tex}
+"""
+
+
+# Every eval report a figure reads, relative to the repo root.
+_REPORT_PATHS = (
+    "eval/v1/report_aggregate_2seeds.json",
+    "eval/v2/report_seed2108.json",
+    "eval/v2_5/report_aggregate_2seeds.json",
+    "eval/v2_6/report_aggregate_2seeds.json",
+)
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -27,6 +110,12 @@ def parse_args() -> argparse.Namespace:
         default=Path("docs/figures/phase1"),
         help="Output directory for figure artifacts",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of figures to render in parallel processes (default: CPU count)",
+    )
     return parser.parse_args()
 
 
@@ -34,14 +123,28 @@ def load_json(path: Path) -> dict:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
+def load_reports(repo_root: Path) -> dict[str, dict]:
+    """Parse every eval report the figures use, keyed by repo-relative path.
+
+    This runs once in the parent, and the parsed reports are handed to the
+    figure jobs, so the v2.5 and v2.6 aggregates that feed several figures
+    are not re-read in each worker process. Callers must treat the reports
+    as read-only.
+    """
+    # The reports are independent small reads, so they load together.
+    with ThreadPoolExecutor(max_workers=len(_REPORT_PATHS)) as executor:
+        reports = executor.map(load_json, [repo_root / p for p in _REPORT_PATHS])
+        return dict(zip(_REPORT_PATHS, reports))
+
+
 def save_dual(fig: Figure, out_base: Path) -> None:
     out_base.parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out_base.with_suffix(".pdf"), bbox_inches="tight")
     fig.savefig(out_base.with_suffix(".png"), dpi=220, bbox_inches="tight")
 
 
-def make_money_plot(repo_root: Path, out_dir: Path) -> None:
-    report = load_json(repo_root / "eval/v2_6/report_aggregate_2seeds.json")
+def make_money_plot(reports: dict[str, dict], out_dir: Path) -> None:
+    report = reports["eval/v2_6/report_aggregate_2seeds.json"]
 
     rust_compile = report["summary"]["rust"]["compile_at_1"]["mean"]
     rust_test = report["summary"]["rust"]["test_at_1"]["mean"]
@@ -52,19 +155,19 @@ def make_money_plot(repo_root: Path, out_dir: Path) -> None:
     rust_vals = [rust_compile, rust_test]
     iron_vals = [iron_compile, iron_test]
 
-    x = range(len(metrics))
+    x = np.arange(len(metrics))
     width = 0.36
 
     fig, ax = plt.subplots(figsize=(7.8, 4.8))
     rust_bars = ax.bar(
-        [i - width / 2 for i in x],
+        x - width / 2,
         rust_vals,
         width,
         label="Rust arm",
         color="#4C78A8",
     )
     iron_bars = ax.bar(
-        [i + width / 2 for i in x],
+        x + width / 2,
         iron_vals,
         width,
         label="Iron arm",
@@ -73,7 +176,7 @@ def make_money_plot(repo_root: Path, out_dir: Path) -> None:
 
     ax.set_ylim(0.0, 1.05)
     ax.set_ylabel("Rate")
-    ax.set_xticks(list(x), metrics)
+    ax.set_xticks(x, metrics)
     ax.set_title("Final Performance (v2.6 aggregate, 2 seeds)")
     ax.grid(axis="y", linestyle="--", alpha=0.35)
     ax.legend(frameon=False, loc="upper left")
@@ -95,30 +198,17 @@ def make_money_plot(repo_root: Path, out_dir: Path) -> None:
     plt.close(fig)
 
 
-def make_progression_plot(repo_root: Path, out_dir: Path) -> None:
+def make_progression_plot(reports: dict[str, dict], out_dir: Path) -> None:
+    v1 = reports["eval/v1/report_aggregate_2seeds.json"]
+    v2 = reports["eval/v2/report_seed2108.json"]
+    v2_5 = reports["eval/v2_5/report_aggregate_2seeds.json"]
+    v2_6 = reports["eval/v2_6/report_aggregate_2seeds.json"]
+
     points = [
-        (
-            "v1",
-            load_json(repo_root / "eval/v1/report_aggregate_2seeds.json")["summary"][
-                "iron"
-            ]["test_at_1"]["mean"],
-        ),
-        (
-            "v2",
-            load_json(repo_root / "eval/v2/report_seed2108.json")["iron"]["test_at_1"],
-        ),
-        (
-            "v2.5",
-            load_json(repo_root / "eval/v2_5/report_aggregate_2seeds.json")["summary"][
-                "iron"
-            ]["test_at_1"]["mean"],
-        ),
-        (
-            "v2.6",
-            load_json(repo_root / "eval/v2_6/report_aggregate_2seeds.json")["summary"][
-                "iron"
-            ]["test_at_1"]["mean"],
-        ),
+        ("v1", v1["summary"]["iron"]["test_at_1"]["mean"]),
+        ("v2", v2["iron"]["test_at_1"]),
+        ("v2.5", v2_5["summary"]["iron"]["test_at_1"]["mean"]),
+        ("v2.6", v2_6["summary"]["iron"]["test_at_1"]["mean"]),
     ]
 
     labels = [p[0] for p in points]
@@ -150,8 +240,8 @@ def make_progression_plot(repo_root: Path, out_dir: Path) -> None:
     plt.close(fig)
 
 
-def make_error_shift_plot(repo_root: Path, out_dir: Path) -> None:
-    report = load_json(repo_root / "eval/v2_5/report_aggregate_2seeds.json")
+def make_error_shift_plot(reports: dict[str, dict], out_dir: Path) -> None:
+    report = reports["eval/v2_5/report_aggregate_2seeds.json"]
     rust_tax = report["error_taxonomy"]["rust"]
     iron_tax = report["error_taxonomy"]["iron"]
 
@@ -199,83 +289,45 @@ def make_syntax_listing(repo_root: Path, out_dir: Path) -> None:
         .strip()
     )
 
-    iron_code = """function closure_shift_001
-    takes x of i32
-    returns i32
-begin
-    define f as closure with parameters n and body n plus 3
-    call f with x
-end function"""
-
-    tex = f"""% Figure 4: syntax comparison using lstlisting
-% Requires packages: listings, caption
-
-\\begin{{figure}}[t]
-\\centering
-\\begin{{minipage}}[t]{{0.48\\linewidth}}
-\\captionof{{lstlisting}}{{Rust snippet}}
-\\begin{{lstlisting}}[language=Rust,basicstyle=\\ttfamily\\small]
-{rust_code}
-\\end{{lstlisting}}
-\\end{{minipage}}\\hfill
-\\begin{{minipage}}[t]{{0.48\\linewidth}}
-\\captionof{{lstlisting}}{{Iron snippet}}
-\\begin{{lstlisting}}[basicstyle=\\ttfamily\\small]
-{iron_code}
-\\end{{lstlisting}}
-\\end{{minipage}}
-\\caption{{Syntax comparison: Rust vs Iron for the same function contract.}}
-\\label{{fig:syntax_comparison}}
-\\end{{figure}}
-"""
-
+    tex = _FIG4_TEMPLATE.substitute(rust_code=rust_code, iron_code=_FIG4_IRON_CODE)
     (out_dir / "fig4_syntax_comparison.tex").write_text(tex, encoding="utf-8")
 
 
 def make_include_snippets(out_dir: Path) -> None:
-    snippets = """% Figure include snippets for LaTeX
-% Add in preamble: \\usepackage{graphicx}, \\usepackage{listings}, \\usepackage{caption}
-
-% Figure 1: Money Plot
-\\begin{figure}[t]
-  \\centering
-  \\includegraphics[width=0.82\\linewidth]{docs/figures/phase1/fig1_money_plot_v26.pdf}
-  \\caption{Final performance comparison (v2.6 aggregate): compile@1 and test@1.}
-  \\label{fig:money_plot}
-\\end{figure}
-
-% Figure 2: Progression
-\\begin{figure}[t]
-  \\centering
-  \\includegraphics[width=0.82\\linewidth]{docs/figures/phase1/fig2_progression_iron_test.pdf}
-  \\caption{Iron test@1 progression across iterations (v1 to v2.6).}
-  \\label{fig:progression}
-\\end{figure}
-
-% Figure 3: Error Shift
-\\begin{figure}[t]
-  \\centering
-  \\includegraphics[width=0.82\\linewidth]{docs/figures/phase1/fig3_error_shift_v25.pdf}
-  \\caption{Failure taxonomy contrast (v2.5 aggregate): Rust semantic failures vs Iron transform failures.}
-  \\label{fig:error_shift}
-\\end{figure}
-
-% Figure 4 uses a listing-based figure snippet:
-% \\input{docs/figures/phase1/fig4_syntax_comparison.tex}
-"""
-    (out_dir / "latex_figure_snippets.tex").write_text(snippets, encoding="utf-8")
+    (out_dir / "latex_figure_snippets.tex").write_text(
+        _INCLUDE_SNIPPETS, encoding="utf-8"
+    )
 
 
 def main() -> int:
     args = parse_args()
     repo_root = args.repo_root.resolve()
     out_dir = (repo_root / args.out_dir).resolve()
+    if args.jobs < 1:
+        print("ERROR: --jobs must be at least 1", file=sys.stderr)
+        return 2
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    make_money_plot(repo_root, out_dir)
-    make_progression_plot(repo_root, out_dir)
-    make_error_shift_plot(repo_root, out_dir)
-    make_syntax_listing(repo_root, out_dir)
+    reports = load_reports(repo_root)
+    figure_jobs = (
+        (make_money_plot, reports),
+        (make_progression_plot, reports),
+        (make_error_shift_plot, reports),
+        (make_syntax_listing, repo_root),
+    )
+    if args.jobs == 1:
+        for make_figure, source in figure_jobs:
+            make_figure(source, out_dir)
+    else:
+        # Each figure is independent and rendering is CPU-bound under the
+        # GIL, so they go to separate processes, each with its own pyplot.
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            futures = [
+                executor.submit(make_figure, source, out_dir)
+                for make_figure, source in figure_jobs
+            ]
+            for future in futures:
+                future.result()
     make_include_snippets(out_dir)
 
     print(f"Wrote figure artifacts to {out_dir}")
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Check that batched compile@1 matches compiling each prediction alone."""
+
+from __future__ import annotations
+
+import shutil
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import evaluate_predictions
+
+# Each entry is (source, crate_name). The first few are valid as a submodule
+# but not as a crate root, or only draw a warning when compiled as a crate.
+CASES = [
+    ("pub(super) fn a(x: i32) -> i32 { x }\n", "rust_super_vis"),
+    ("pub fn b() -> i32 { super::c() }\n", "rust_super_path"),
+    ("pub fn c() -> i32 { 1 }\n", "rust_Upper"),
+    ("#![allow(unused)]\npub fn d() -> i32 { 2 }\n", "rust_inner_attr"),
+    ("pub fn e() -> i32 { crate::f() }\nfn f() -> i32 { 3 }\n", "rust_crate_path"),
+    ("mod missing;\npub fn g() -> i32 { 4 }\n", "rust_out_of_line_mod"),
+    ("pub fn h() -> i32 { 5 }\n", "rust_plain"),
+    ("pub fn i(v: Vec<i32>) -> i32 { v.iter().sum() }\n", "rust_plain_2"),
+    ("pub fn j() -> i32 { \"x\" }\n", "rust_type_error"),
+    ("pub fn k() -> i32 { let x = 1; 6 }\n", "rust_warning"),
+]
+
+
+@unittest.skipIf(shutil.which("rustc") is None, "rustc not installed")
+class CompileBatchTest(unittest.TestCase):
+    def test_batch_matches_single_compiles(self) -> None:
+        single = [evaluate_predictions.compile_rust(s, n) for s, n in CASES]
+        batched = evaluate_predictions.compile_rust_batch(CASES)
+        for case, alone, batch in zip(CASES, single, batched):
+            with self.subTest(crate=case[1]):
+                self.assertEqual(batch, alone)
+
+    def test_unsafe_sources_are_not_batched(self) -> None:
+        for source, name in CASES[:6]:
+            with self.subTest(crate=name):
+                self.assertFalse(evaluate_predictions.batch_eligible(source, name))
+        for source, name in CASES[6:]:
+            with self.subTest(crate=name):
+                self.assertTrue(evaluate_predictions.batch_eligible(source, name))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,8 @@
 
 use clap::{Parser, Subcommand};
 use std::fs;
-use std::path::PathBuf;
+use std::io::{self, BufRead, Read, Write};
+use std::path::{Path, PathBuf};
 use std::process;
 
 #[derive(Parser)]
@@ -18,7 +19,7 @@ struct Cli {
 enum Commands {
     /// Transpile Rust source to Iron
     Reduce {
-        /// Input Rust source file
+        /// Input Rust source file (`-` reads stdin)
         #[arg(value_name = "INPUT")]
         input: PathBuf,
 
@@ -37,14 +38,14 @@ enum Commands {
 
     /// Validate Iron code
     Validate {
-        /// Input Iron file to validate
+        /// Input Iron file to validate (`-` reads stdin)
         #[arg(value_name = "INPUT")]
         input: PathBuf,
     },
 
     /// Transpile Iron source to Rust
     Oxidize {
-        /// Input Iron source file
+        /// Input Iron source file (`-` reads stdin)
         #[arg(value_name = "INPUT")]
         input: PathBuf,
 
@@ -56,6 +57,13 @@ enum Commands {
         #[arg(short = 'V', long)]
         verbose: bool,
     },
+
+    /// Serve reduce/oxidize requests over stdin/stdout until EOF
+    ///
+    /// Each request is a header line `<reduce|oxidize> <LEN>` followed by LEN
+    /// bytes of UTF-8 source. Each response is a header line `<ok|err> <LEN>`
+    /// followed by LEN bytes of output or error message.
+    Serve,
 }
 
 fn main() {
@@ -89,6 +97,12 @@ fn main() {
                 process::exit(1);
             }
         }
+        Commands::Serve => {
+            if let Err(e) = serve() {
+                eprintln!("Error: {}", e);
+                process::exit(1);
+            }
+        }
     }
 }
 
@@ -99,7 +113,7 @@ fn transpile_file(
     verbose: bool,
 ) -> Result<(), Box<dyn std::error::Error>> {
     // Read input file
-    let source = fs::read_to_string(&input)
+    let source = read_input(&input)
         .map_err(|e| format!("Failed to read input file '{}': {}", input.display(), e))?;
 
     if verbose {
@@ -147,7 +161,7 @@ fn transpile_file(
 }
 
 fn validate_file(input: PathBuf) -> Result<(), Box<dyn std::error::Error>> {
-    let content = fs::read_to_string(&input)
+    let content = read_input(&input)
         .map_err(|e| format!("Failed to read file '{}': {}", input.display(), e))?;
 
     if redox::validate_iron(&content) {
@@ -164,7 +178,7 @@ fn oxidize_file(
     verbose: bool,
 ) -> Result<(), Box<dyn std::error::Error>> {
     // Read input file
-    let source = fs::read_to_string(&input)
+    let source = read_input(&input)
         .map_err(|e| format!("Failed to read input file '{}': {}", input.display(), e))?;
 
     if verbose {
@@ -200,3 +214,92 @@ fn oxidize_file(
 
     Ok(())
 }
+
+/// Read an input file, treating `-` as stdin
+fn read_input(input: &Path) -> io::Result<String> {
+    if input == Path::new("-") {
+        let mut source = String::new();
+        io::stdin().read_to_string(&mut source)?;
+        Ok(source)
+    } else {
+        fs::read_to_string(input)
+    }
+}
+
+fn serve() -> Result<(), Box<dyn std::error::Error>> {
+    let stdin = io::stdin();
+    let mut reader = stdin.lock();
+    let stdout = io::stdout();
+    let mut writer = stdout.lock();
+    let mut header = String::new();
+
+    loop {
+        header.clear();
+        if reader.read_line(&mut header)? == 0 {
+            return Ok(());
+        }
+
+        let (op, len) = parse_serve_header(&header)?;
+        let mut payload = vec![0; len];
+        reader
+            .read_exact(&mut payload)
+            .map_err(|e| format!("Failed to read {} byte request body: {}", len, e))?;
+
+        let (status, body) = match serve_request(op, payload) {
+            Ok(output) => ("ok", output),
+            Err(message) => ("err", message),
+        };
+        writeln!(writer, "{} {}", status, body.len())?;
+        writer.write_all(body.as_bytes())?;
+        writer.flush()?;
+    }
+}
+
+fn parse_serve_header(header: &str) -> Result<(&str, usize), String> {
+    let trimmed = header.trim_end();
+    let (op, len) = trimmed
+        .split_once(' ')
+        .ok_or_else(|| format!("Malformed request header '{}'", trimmed))?;
+    let len = len
+        .parse::<usize>()
+        .map_err(|e| format!("Invalid request length in header '{}': {}", trimmed, e))?;
+    Ok((op, len))
+}
+
+fn serve_request(op: &str, payload: Vec<u8>) -> Result<String, String> {
+    let source =
+        String::from_utf8(payload).map_err(|e| format!("Request body is not UTF-8: {}", e))?;
+
+    match op {
+        "reduce" => redox::transpile(&source).map_err(|e| format!("Transpilation failed: {}", e)),
+        "oxidize" => redox::oxidize(&source).map_err(|e| format!("Oxidation failed: {}", e)),
+        _ => Err(format!("Unknown request '{}'", op)),
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_parse_serve_header() {
+        assert_eq!(parse_serve_header("reduce 42\n"), Ok(("reduce", 42)));
+        assert_eq!(parse_serve_header("oxidize 0\n"), Ok(("oxidize", 0)));
+        assert!(parse_serve_header("reduce\n").is_err());
+        assert!(parse_serve_header("reduce abc\n").is_err());
+    }
+
+    #[test]
+    fn test_serve_request_reports_errors_as_messages() {
+        let iron = serve_request("reduce", b"fn one() -> i32 { 1 }".to_vec())
+            .expect("reduce request should succeed");
+        assert!(iron.contains("function one"));
+
+        let err = serve_request("reduce", b"fn broken(".to_vec())
+            .expect_err("invalid Rust should produce an error message");
+        assert!(err.starts_with("Transpilation failed:"));
+
+        let err = serve_request("compile", Vec::new()).expect_err("unknown op should fail");
+        assert_eq!(err, "Unknown request 'compile'");
+    }
+}